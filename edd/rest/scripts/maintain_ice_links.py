@@ -15,9 +15,6 @@ It's safest to schedule runs of this script during off-hours when users are less
 making changes.
 """
 
-from __future__ import division
-from __future__ import unicode_literals
-
 ####################################################################################################
 # set default source for ICE settings BEFORE importing any code from jbei.rest.clients.ice. Otherwise,
 # code in that module will attempt to look for a django settings module and fail if django isn't
@@ -25,28 +22,34 @@ from __future__ import unicode_literals
 import json
 import os
 
-from collections import OrderedDict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 import argparse
-import arrow
-import locale
 import logging
+import queue
 import re
 import requests
+import threading
+import time
 from logging.config import dictConfig
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 from urllib.parse import urlparse
 
 from jbei.rest.auth import EddSessionAuth, IceSessionAuth
 from jbei.rest.clients.edd.api import EddApi
 from jbei.rest.clients.ice.api import IceApi, Strain as IceStrain
-from jbei.rest.clients.ice.api import ICE_ENTRY_TYPES
+from jbei.rest.clients.ice.api import ENTRY_CACHE_SIZE, ENTRY_CACHE_TTL, ICE_ENTRY_TYPES
+from jbei.rest.sessions import mount_retrying_adapter
 from rest.utils import is_url_secure
 from utils import to_human_relevant_delta, UserInputTimer, session_login, TYPICAL_UUID_PATTERN
 
 from . import settings
 from .settings import (EDD_URL, EDD_PRODUCTION_HOSTNAMES, ICE_PRODUCTION_HOSTNAMES, ICE_URL,
-                       VERIFY_EDD_CERT, VERIFY_ICE_CERT, EDD_REQUEST_TIMEOUT, ICE_REQUEST_TIMEOUT)
+                       VERIFY_EDD_CERT, VERIFY_ICE_CERT, EDD_REQUEST_TIMEOUT, ICE_REQUEST_TIMEOUT,
+                       REQUEST_POOL_SIZE, REQUEST_MAX_RETRIES)
 
 dictConfig(settings.LOGGING)
 
@@ -60,11 +63,50 @@ logger = logging.getLogger(__name__)
 # processing efficient in aggregate
 EDD_RESULT_PAGE_SIZE = ICE_RESULT_PAGE_SIZE = 100
 
+# number of concurrent ICE requests used to look up the entries referenced by a page of EDD
+# strains. Strain processing itself stays sequential so that output and ProcessingSummary updates
+# remain ordered, but overlapping the entry lookups hides most of the per-request ICE latency.
+ICE_ENTRY_PREFETCH_WORKERS = 8
+
+# backoff factor for the delay between retries of failed requests to EDD / ICE
+REQUEST_RETRY_BACKOFF_FACTOR = 0.2
+
+# number of times processing is attempted for each EDD strain that fails on a connection error or
+# timeout during the EDD scan, before giving up on it and moving on to the next one. The changes
+# made to EDD and ICE are idempotent, and outcomes recorded by a failed attempt are discarded, so a
+# strain that fails part way through can safely be processed again from the start.
+STRAIN_PROCESSING_ATTEMPTS = 3
+
 ###################################################################################################
 
 SEPARATOR_CHARS = 75
 OUTPUT_SEPARATOR = ''.join(['*' for index in range(1, SEPARATOR_CHARS)])
-fill_char = b'.'
+fill_char = '.'
+
+
+def column_widths(rows, space):
+    """
+    Computes the title and value column widths needed to display (title, value) rows in aligned
+    columns.
+    """
+    title_col_width = max(len(title) for title, _ in rows) + space
+    value_col_width = max(len(value) for _, value in rows) + space
+    return title_col_width, value_col_width
+
+
+def print_aligned_rows(rows, space=None, widths=None, indent='', separator=fill_char):
+    """
+    Prints (title, value) rows in two columns, padded with fill_char so they line up. Rows are
+    joined and printed with a single call.
+    :param space: the minimum padding between columns. Ignored if widths is provided.
+    :param widths: a (title, value) tuple of column widths, e.g. from column_widths() if several
+        groups of rows should be aligned with each other
+    """
+    rows = list(rows)
+    title_col_width, value_col_width = widths if widths else column_widths(rows, space)
+    print('\n'.join(separator.join(('%s%s' % (indent, title.ljust(title_col_width, fill_char)),
+                                    value.rjust(value_col_width, fill_char)))
+                    for title, value in rows))
 
 # link processing outcomes for do_initial_run_entry_link_processing
 NOT_PROCESSED_OUTCOME = 'NOT_PROCESSED'
@@ -75,16 +117,29 @@ UPDATED_PERL_URL_OUTCOME = 'UPDATED_PERL_URL'
 REMOVED_BAD_STUDY_LINK = 'REMOVED_NON_EXISTENT_STUDY_LINK'
 REMOVED_DUPLICATE_STUDY_LINK = 'REMOVED_DUPLICATE_STUDY_LINK'
 UPDATED_WRONG_HOSTNAME_OUTCOME = 'UPDATED_WRONG_HOSTNAME'
+RENAMED_UNMAINTAINED_LINK_OUTCOME = 'RENAMED_UNMAINTAINED_LINK'
+SKIPPED_VALID_LINK_OUTCOME = 'SKIPPED_VALID_LINK'
+SKIPPED_EXTERNAL_LINK_OUTCOME = 'SKIPPED_EXTERNAL_LINK'
+CREATED_MISSING_LINK_OUTCOME = 'CREATED_MISSING_LINK'
 UPDATED_OLD_LINK_OUTCOMES = (UPDATED_PERL_URL_OUTCOME, UPDATED_WRONG_HOSTNAME_OUTCOME)
 
+# link categories reported by build_edd_link_pattern() via match.lastgroup
+STUDY_LINK = 'study'
+PERL_STUDY_LINK = 'perl_study'
+WRONG_HOSTNAME_LINK = 'wrong_hostname'
+
 # detect & fix links resulting from an incorrect hostname value briefly in place in EDD's
 # production database following deployment of SYNBIO-1105 / corrected in SYNBIO-1312.
-WRONG_HOSTNAME_PATTERN = re.compile('^http(?:s?)://edd.jbei.lbl.gov/study/(?P<study_id>\d+)/?$',
-                                    re.IGNORECASE)
+_WRONG_HOSTNAME_REGEX = r'edd\.jbei\.lbl\.gov/study/\d+/?'
 
-_DEVELOPER_MACHINE_NAMES = ['gbirkel-mr.dhcp.lbl.gov', 'mforrer-mr.dhcp.lbl.gov',
-                           'jeads-mr.dhcp.lbl.gov', 'wcmorrell-mr.dhcp.lbl.gov', 'edd.lvh.me',
-                           'localhost', '127.0.0.1']
+_DEVELOPER_MACHINE_NAMES = frozenset(['gbirkel-mr.dhcp.lbl.gov', 'mforrer-mr.dhcp.lbl.gov',
+                                      'jeads-mr.dhcp.lbl.gov', 'wcmorrell-mr.dhcp.lbl.gov',
+                                      'edd.lvh.me', 'localhost', '127.0.0.1'])
+
+# lower-case sets of the configured production hostnames for constant-time lookup. Settings
+# overrides may provide them in any case, and as any iterable.
+_EDD_PRODUCTION_HOSTNAMES = frozenset(hostname.lower() for hostname in EDD_PRODUCTION_HOSTNAMES)
+_ICE_PRODUCTION_HOSTNAMES = frozenset(hostname.lower() for hostname in ICE_PRODUCTION_HOSTNAMES)
 
 
 class Performance(object):
@@ -95,25 +150,23 @@ class Performance(object):
 
     def __init__(self):
         #######################################
-        # time tracking
+        # time tracking. Times are time.monotonic() values and durations are in seconds, except
+        # for communication times, which are timedeltas read from the EDD/ICE sessions
         #######################################
-        now = arrow.utcnow()
-        zero_timedelta = now - now
-
-        self._overall_start_time = now
+        self._overall_start_time = time.monotonic()
         self._overall_end_time = None
         self._total_time = None
-        self.ice_communication_time = zero_timedelta
-        self.edd_communication_time = zero_timedelta
+        self.ice_communication_time = timedelta(0)
+        self.edd_communication_time = timedelta(0)
         self.ice_entry_scan_start_time = None
-        self.ice_entry_scan_time = zero_timedelta
-        self.edd_strain_scan_time = zero_timedelta
+        self.ice_entry_scan_time = 0
+        self.edd_strain_scan_time = 0
 
     def completed_edd_strain_scan(self):
-        self.edd_strain_scan_time = arrow.utcnow() - self._overall_start_time
+        self.edd_strain_scan_time = time.monotonic() - self._overall_start_time
 
     def started_ice_entry_scan(self):
-        self.ice_entry_scan_start_time = arrow.utcnow()
+        self.ice_entry_scan_start_time = time.monotonic()
 
     @property
     def overall_end_time(self):
@@ -131,36 +184,26 @@ class Performance(object):
         print('Performance Summary')
         print(OUTPUT_SEPARATOR)
 
-        # build up a dictionary of result titles -> values
+        # build up a list of (result title, value) rows
         total_runtime = self._overall_end_time - self._overall_start_time
-        print('Total run time: %s' % to_human_relevant_delta(total_runtime.total_seconds()))
-        values_dict = OrderedDict()
-
-        edd_duration_key = 'EDD strain scan duration'
-        ice_duration_key = 'ICE entry scan duration:'
-        values_dict[edd_duration_key] = 'Not performed'
-        values_dict[ice_duration_key] = 'Not performed'
-
-        if self.edd_strain_scan_time:
-            values_dict[edd_duration_key] = (to_human_relevant_delta(
-                self.edd_strain_scan_time.total_seconds()))
-
-        if self.ice_entry_scan_time:
-            values_dict[ice_duration_key] = (to_human_relevant_delta(
-                self.ice_entry_scan_time.total_seconds()))
-
-        values_dict['Total EDD communication time'] = to_human_relevant_delta(
-                self.edd_communication_time.total_seconds())
-        values_dict['Total ICE communication time'] = to_human_relevant_delta(
-                self.ice_communication_time.total_seconds())
-
-        # compute column widths for readable display
-        space = 2
-        title_col_width = max(len(title) for title in values_dict.keys()) + space
-        value_col_width = max(len(value) for value in values_dict.values()) + space
-        for title, value in values_dict.items():
-            indented_title = "\t\t%s" % title.ljust(title_col_width, fill_char)
-            print(fill_char.join((indented_title, value.rjust(value_col_width, fill_char))))
+        print('Total run time: %s' % to_human_relevant_delta(total_runtime))
+
+        edd_duration = ('Not performed' if not self.edd_strain_scan_time else
+                        to_human_relevant_delta(self.edd_strain_scan_time))
+        ice_duration = ('Not performed' if not self.ice_entry_scan_time else
+                        to_human_relevant_delta(self.ice_entry_scan_time))
+        rows = [
+            ('EDD strain scan duration', edd_duration),
+            ('ICE entry scan duration:', ice_duration),
+            ('Total EDD communication time', to_human_relevant_delta(
+                self.edd_communication_time.total_seconds())),
+            ('Total ICE communication time', to_human_relevant_delta(
+                self.ice_communication_time.total_seconds())),
+        ]
+
+        print_aligned_rows(rows, space=2, indent='\t\t')
+        print('\t\t(communication times add up concurrent prefetch requests, so may exceed the '
+              'scan durations)')
 
 
 class StrainProcessingPerformance:
@@ -168,6 +211,14 @@ class StrainProcessingPerformance:
     Tracks simple runtime performance metrics for processing of a single EDD strain
     """
 
+    # one of these is created for every strain in a scan, so avoid a __dict__ for each
+    __slots__ = ('strain', 'start_time', '_total_time', '_end_time', 'edd_study_search_time',
+                 'strain_processing_start', '_starting_ice_communication_delta',
+                 '_starting_edd_communication_delta', '_edd_communication_delta',
+                 '_ice_communication_delta', 'ice_link_search_time', 'ice_link_cache_lifetime',
+                 'links_updated', 'links_removed', 'links_skipped', 'links_unprocessed',
+                 'studies_unprocessed', 'scan_percent_when_complete')
+
     def __init__(self, strain, start_time, starting_ice_communication_delta,
                  starting_edd_communication_delta, scan_percent_when_complete=None):
         self.strain = strain
@@ -183,7 +234,7 @@ class StrainProcessingPerformance:
         self._edd_communication_delta = None
         self._ice_communication_delta = None
 
-        self.ice_link_search_delta = None
+        self.ice_link_search_time = None
         self.ice_link_cache_lifetime = None
         self.links_updated = 0
         self.links_removed = 0
@@ -199,14 +250,14 @@ class StrainProcessingPerformance:
 
         print('Run time for strain "%(name)s" (pk=%(pk)d): %(time)s' % {
             'name': self.strain.name, 'pk': self.strain.pk,
-            'time': to_human_relevant_delta(self._total_time.total_seconds()),
+            'time': to_human_relevant_delta(self._total_time),
         })
         # print('\tTotal EDD communication: %s' % to_human_relevant_delta(
         #         self._edd_communication_delta.total_seconds()))
         # print('\tTotal ICE communication: %s' % to_human_relevant_delta(
         #         self._ice_communication_delta.total_seconds()))
         # print('\tICE strain experiments cache lifetime: %s' % to_human_relevant_delta(
-        #         self.ice_link_cache_lifetime.total_seconds()))
+        #         self.ice_link_cache_lifetime))
         # print('\tICE links processed: %d' % (self.links_updated + self.links_removed +
         #                                      self.links_skipped))
 
@@ -221,6 +272,8 @@ class StrainProcessingPerformance:
         return self._end_time
 
     def set_end_time(self, value, end_edd_communication_delta, end_ice_communation_delta):
+        # note that the communication deltas are read from sessions shared with the threads that
+        # prefetch lookups for later strains, so they include some time spent on those lookups
         self._end_time = value
         self._total_time = self.end_time - self.start_time
         self._edd_communication_delta = (end_edd_communication_delta -
@@ -249,6 +302,10 @@ class IceTestStub(IceApi):
         self._prevent_write_while_disabled()
         pass
 
+    def remove_experiment_links(self, ice_entry_id, link_ids):
+        self._prevent_write_while_disabled()
+        pass
+
 
 class EddTestStub(EddApi):
     """
@@ -267,15 +324,25 @@ class EddTestStub(EddApi):
         pass
 
 
-def build_study_url_pattern(edd_link_target_hostname):
-    return re.compile(
-            r'^http(?:s?)://%s/study/(?P<study_id>\d+)/?$' % re.escape(edd_link_target_hostname),
-            re.IGNORECASE)
-
+def build_edd_link_pattern(edd_link_target_hostname):
+    """
+    Builds a single pattern that matches all the known URL formats for ICE experiment links to
+    studies in the target EDD instance, so each link only has to be scanned once. The name of the
+    matching group (match.lastgroup) is one of STUDY_LINK, PERL_STUDY_LINK, or
+    WRONG_HOSTNAME_LINK, and identifies which format the link uses.
 
-def build_perl_study_url_pattern(edd_link_target_hostname):
-    return re.compile(r'^http(?:s?)://%s/study\.cgi\?studyid=(?P<study_id>\d+)/?$' % re.escape(
-        edd_link_target_hostname), re.IGNORECASE)
+    Link URLs are lower-cased once when experiment links are cached, so the pattern is
+    case-sensitive and should be used via fullmatch() on lower-case URLs.
+    """
+    hostname = re.escape(edd_link_target_hostname.lower())
+    return re.compile(
+            r'http(?:s?)://(?:'
+            r'(?P<%(study)s>%(hostname)s/study/\d+/?)|'
+            r'(?P<%(perl)s>%(hostname)s/study\.cgi\?studyid=\d+/?)|'
+            r'(?P<%(wrong_host)s>%(wrong_host_regex)s))' % {
+                'study': STUDY_LINK, 'perl': PERL_STUDY_LINK, 'wrong_host': WRONG_HOSTNAME_LINK,
+                'hostname': hostname, 'wrong_host_regex': _WRONG_HOSTNAME_REGEX,
+            }, re.ASCII)
 
 
 def build_perl_study_url(local_study_pk, edd_hostname, https=False):
@@ -286,36 +353,57 @@ def build_perl_study_url(local_study_pk, edd_hostname, https=False):
     :param edd_hostname: the host name for EDD
     """
     scheme = 'https' if https else 'http'
-    return '%(scheme)s://%(hostname)s/Study.cgi?studyID=%(study_pk)s' % {
-        'hostname': edd_hostname, 'scheme': scheme, 'study_pk': local_study_pk
-    }
+    return '%s://%s/Study.cgi?studyID=%s' % (scheme, edd_hostname, local_study_pk)
+
+
+@lru_cache(maxsize=64)
+def _hostname(url):
+    """
+    Gets the lower-case hostname from the input URL. Only a handful of distinct base URLs are
+    parsed during a run, but some of them are parsed once per study, so results are cached.
+    """
+    return urlparse(url).hostname.lower()
 
 
 def is_edd_production_url(url):
     """
     Tests whether the input URL references a known list of production host names.
     """
-    url_parts = urlparse(url)
-    hostname = url_parts.hostname.lower()
-    return hostname in EDD_PRODUCTION_HOSTNAMES
+    return _hostname(url) in _EDD_PRODUCTION_HOSTNAMES
 
 
 def is_ice_production_url(url):
     """
     Tests whether the input URL references a known list of production host names.
     """
-    url_parts = urlparse(url)
-    hostname = url_parts.hostname.lower()
-    return hostname in ICE_PRODUCTION_HOSTNAMES
+    return _hostname(url) in _ICE_PRODUCTION_HOSTNAMES
+
+
+# cache of username -> admin status already looked up in ICE. The script only connects to a
+# single ICE instance per run, so the username alone is a sufficient key.
+_ice_admin_user_cache = {}
 
 
 def is_ice_admin_user(ice, username):
     """
-    Contacts ICE to test whether the provided username has administrative privileges in ICE
+    Contacts ICE to test whether the provided username has administrative privileges in ICE.
+    Results are cached for the remainder of the run, since paging through ICE's users is
+    expensive and admin status isn't expected to change while the script is running. Failed
+    lookups (None) aren't cached, so they're attempted again on the next check.
     """
+    if username in _ice_admin_user_cache:
+        return _ice_admin_user_cache[username]
+
+    is_admin = _lookup_ice_admin_user(ice, username)
+    if is_admin is not None:
+        _ice_admin_user_cache[username] = is_admin
+    return is_admin
+
+
+def _lookup_ice_admin_user(ice, username):
     try:
         page_result = ice.search_users(search_string=username)
-        user_email_pattern = re.compile('%s@.+' % username, re.IGNORECASE)
+        user_email_pattern = re.compile('%s@.+' % re.escape(username), re.IGNORECASE)
 
         while page_result:
 
@@ -325,12 +413,14 @@ def is_ice_admin_user(ice, username):
 
             if page_result.next_page:
                 page_result = ice.search_users(query_url=page_result.next_page)
+            else:
+                page_result = None
     except HTTPError as h:
-        if h.response.code == 403:
+        if h.response.status_code == 403:
             return False
 
-        if h.response.code == 500:  # work around ICE's imprecise return codes,at the cost of
-            # masking actual internal server errors (SYNBIO-1359)
+        if h.response.status_code == 500:  # work around ICE's imprecise return codes,at the
+            # cost of masking actual internal server errors (SYNBIO-1359)
             return False
 
     return None
@@ -353,20 +443,11 @@ class ProcessingSummary:
         self._total_ice_entries_processed = 0
         self._total_edd_strains_found = 0
         self._total_ice_entries_found = 0
-        self._existing_links_processed = 0
-        self._invalid_links_pruned = 0
-        self._development_links_pruned = 0
-        self._test_links_pruned = 0
-        self._unmaintained_links_renamed = 0
-        self._duplicate_links_removed = 0
-        self._valid_links_skipped = 0
-        self._missing_links_created = 0
-        self._non_strain_ice_parts_referenced = 0
-        self._perl_links_updated = 0
-        self._wrong_hostname_links_updated = 0
-        self._skipped_external_links = 0
-
-        self._previously_processed_strains_skipped = {}
+
+        # counts of link processing outcomes, keyed by the *_OUTCOME constants
+        self._link_outcomes = Counter()
+
+        self._previously_processed_strains_skipped = set()
 
         self._up_to_date_strains = []
         self._strains_with_changes = []
@@ -375,20 +456,50 @@ class ProcessingSummary:
         self._non_strain_ice_parts_referenced = []
         self._updated_edd_strain_text = []
         self._edd_strains_w_different_text = []
+        self._failed_edd_strains = []
+
+        self._processed_edd_strain_uuids = set()
+
+        # UUIDs of strains processed during a prior, possibly interrupted run (see -resume_file)
+        self._prior_run_strain_uuids = set()
+        self._prior_run_strains_skipped = 0
 
-        self._processed_edd_strain_uuids = {}
-        self._processed_edd_strain_lookup_counts = {}
+    def checkpoint(self):
+        """
+        Captures the current processing results, so any recorded afterward can be discarded by
+        rollback(), e.g. if processing a strain fails part way through. Lists of results are only
+        ever appended to, so just their lengths are captured.
+        """
+        state = {}
+        for name, value in vars(self).items():
+            if isinstance(value, list):
+                state[name] = len(value)
+            elif isinstance(value, (set, Counter)):
+                state[name] = value.copy()
+            else:
+                state[name] = value
+        return state
+
+    def rollback(self, checkpoint):
+        """
+        Discards processing results recorded since checkpoint() returned the checkpoint
+        """
+        for name, value in checkpoint.items():
+            current = getattr(self, name)
+            if isinstance(current, list):
+                del current[value:]
+            else:
+                setattr(self, name, value)
 
     ################################################################################################
     # Read-only properties where we want to force additional data capture
     ################################################################################################
 
     def skipped_external_link(self, ice_entry, link):
-        self._existing_links_processed += 1
-        self._skipped_external_links += 1
+        self._link_outcomes[SKIPPED_EXTERNAL_LINK_OUTCOME] += 1
 
         logger.warning('Leaving external or malformed link to %(link_url)s in place from ICE part '
-                       '%(part_id)s (uuid %(entry_uuid)s)' % {
+                       '%(part_id)s (uuid %(entry_uuid)s)', {
                            'link_url': link.url, 'part_id': ice_entry.part_id,
                            'entry_uuid': ice_entry.uuid,
                        })
@@ -407,48 +518,62 @@ class ProcessingSummary:
 
     @property
     def valid_links_skipped(self):
-        return self._valid_links_skipped
+        return self._link_outcomes[SKIPPED_VALID_LINK_OUTCOME]
 
     @property
     def unmaintained_links_renamed(self):
-        return self._unmaintained_links_renamed
+        return self._link_outcomes[RENAMED_UNMAINTAINED_LINK_OUTCOME]
 
     @property
     def development_links_pruned(self):
-        return self._development_links_pruned
+        return self._link_outcomes[REMOVED_DEVELOPMENT_URL_OUTCOME]
 
     @property
     def invalid_links_pruned(self):
-        return self._invalid_links_pruned
+        return self._link_outcomes[REMOVED_BAD_STUDY_LINK]
 
     ################################################################################################
 
     def is_edd_strain_processed(self, entry_uuid):
-        # TODO: remove debug block & helping dict data member
-        lookup_count = self._processed_edd_strain_lookup_counts.get(entry_uuid, 0)
-        self._processed_edd_strain_lookup_counts[entry_uuid] = lookup_count + 1
-        if lookup_count > 1:
-            logger.warning('Looked up processing status for entry %s %d times' % (entry_uuid,
-                                                                                  lookup_count))
+        return (entry_uuid in self._processed_edd_strain_uuids or
+                entry_uuid in self._prior_run_strain_uuids)
+
+    def is_processed_in_prior_run(self, entry_uuid):
+        return entry_uuid in self._prior_run_strain_uuids
+
+    def resumed_prior_run(self, strain_uuids):
+        self._prior_run_strain_uuids.update(strain_uuids)
+
+    @property
+    def processed_strain_uuids(self):
+        """
+        Gets the UUIDs of all strains processed during this run or a prior run being resumed
+        """
+        return self._processed_edd_strain_uuids | self._prior_run_strain_uuids
 
-        processed = self._processed_edd_strain_uuids.get(entry_uuid, False)
-        return processed
+    def skipped_prior_run_strain(self, strain):
+        print('Already processed strain "%(name)s" (pk=%(pk)d) in a prior run...skipping it' % {
+            'name': strain.name, 'pk': strain.pk,
+        })
+        self._prior_run_strains_skipped += 1
 
     def updated_edd_strain_text(self, edd_strain, ice_entry, old_name=None, new_name=None,
                                 old_description=None, new_description=None):
         self._updated_edd_strain_text.append(edd_strain)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         name_change = 'old_name = "%s", new_name="%s"' % (old_name, new_name) if new_name else ''
         description_change = 'old_desc = "%s", new_desc="%s"' % (old_description, new_description)
-        logger.info('Updated name and/or description to make EDD strain match ICE. %s %s' % (
-            name_change, description_change))
+        logger.info('Updated name and/or description to make EDD strain match ICE. %s %s',
+                    name_change, description_change)
 
     def found_strain_text_diff(self, edd_strain, ice_entry, edd_name=None, ice_name=None,
                                edd_description=None, ice_description=None):
         self._edd_strains_w_different_text.append(edd_strain)
         name_diff = 'edd_name = "%s", ice_name="%s"' % (edd_name, ice_name) if ice_name else ''
         description_diff = 'edd_desc = "%s", ice_desc="%s"' % (edd_description, ice_description)
-        logger.warning("Strain name and/or description don't match ICE. %s %s" % (
-            name_diff, description_diff))
+        logger.warning("Strain name and/or description don't match ICE. %s %s", name_diff,
+                       description_diff)
 
     @property
     def total_edd_strains_found(self):
@@ -469,27 +594,24 @@ class ProcessingSummary:
     # TODO: this needs to be used! See _DEVELOPER_MACHINE_NAMES above for detecting known links to
     # developer's machines that should be removed from prod/test databases
     def removed_development_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._development_links_pruned += 1
+        self._link_outcomes[REMOVED_DEVELOPMENT_URL_OUTCOME] += 1
 
-        logger.info('Removed development link %(link_url)s from ICE entry %(entry_uuid)s' % {
+        logger.info('Removed development link %(link_url)s from ICE entry %(entry_uuid)s', {
             'link_url': experiment_link.url, 'entry_uuid': ice_entry.uuid,
         })
 
     def removed_test_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._test_links_pruned += 1
+        self._link_outcomes[REMOVED_TEST_URL_OUTCOME] += 1
 
-        logger.info('Removed test link %(link_url)s from ICE entry %(entry_uuid)s' % {
+        logger.info('Removed test link %(link_url)s from ICE entry %(entry_uuid)s', {
             'link_url': experiment_link.url, 'entry_uuid': ice_entry.uuid,
         })
 
     def removed_invalid_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._invalid_links_pruned += 1
+        self._link_outcomes[REMOVED_BAD_STUDY_LINK] += 1
 
         logger.info(
-            'Removed invalid link %(link_url)s from ICE entry %(part_id)s %(entry_uuid)s' % {
+            'Removed invalid link %(link_url)s from ICE entry %(part_id)s %(entry_uuid)s', {
                 'link_url': experiment_link.url, 'part_id': ice_entry.part_id,
                 'entry_uuid': ice_entry.uuid,
             })
@@ -498,66 +620,61 @@ class ProcessingSummary:
         self.processed_edd_strain(edd_strain)
         self._up_to_date_strains.append(edd_strain)
         logger.info('Strain has up-to-date ICE links %(strain_pk)d / %(part_id)s / '
-                    '%(entry_uuid)s' % {
+                    '%(entry_uuid)s', {
                         'strain_pk': edd_strain.pk, 'part_id': ice_entry.part_id,
                         'entry_uuid': ice_entry.uuid,
                     })
 
     def renamed_unmaintained_link(self, ice_entry, existing_link, new_link_name):
-        self._existing_links_processed += 1
-        self._unmaintained_links_renamed += 1
+        self._link_outcomes[RENAMED_UNMAINTAINED_LINK_OUTCOME] += 1
 
         logger.info('Renamed unmaintained link from %(old_name)s to %(new_name)s to %(link_url)s '
-                    'from ICE entry %(part_id)s (uuid %(entry_uuid)s)' % {
-                        'part_id': ice_entry.part_id, 'old_name': existing_link.name,
+                    'from ICE entry %(part_id)s (uuid %(entry_uuid)s)', {
+                        'part_id': ice_entry.part_id, 'old_name': existing_link.label,
                         'new_name': new_link_name, 'link_url': existing_link.url,
                         'entry_uuid': ice_entry.uuid,
                     })
 
     def skipped_valid_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._valid_links_skipped += 1
+        self._link_outcomes[SKIPPED_VALID_LINK_OUTCOME] += 1
 
         logger.info('Skipped valid link %(link_url)s from ICE entry %(part_number)s '
-                    '(uuid %(entry_uuid)s)' % {
+                    '(uuid %(entry_uuid)s)', {
                         'part_number': ice_entry.part_id, 'link_url': experiment_link.url,
                         'entry_uuid': ice_entry.uuid,
                     })
 
     def updated_perl_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._perl_links_updated += 1
+        self._link_outcomes[UPDATED_PERL_URL_OUTCOME] += 1
 
         logger.info('Updated perl link %(link_url)s from ICE entry %(part_number)s '
-                    '(uuid %(entry_uuid)s)' % {
+                    '(uuid %(entry_uuid)s)', {
                         'part_number': ice_entry.part_id, 'link_url': experiment_link.url,
                         'entry_uuid': ice_entry.uuid,
                     })
 
     def removed_duplicate_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._duplicate_links_removed += 1
+        self._link_outcomes[REMOVED_DUPLICATE_STUDY_LINK] += 1
 
         logger.info('Removed duplicate link %(link_url)s from ICE entry %(part_number)s '
                     '(uuid %(entry_uuid)s). Duplicates include old-format URLs that resolve to '
-                    'the the same up-to-date URL as an existing link.' % {
+                    'the the same up-to-date URL as an existing link.', {
                         'part_number': ice_entry.part_id, 'link_url': experiment_link.url,
                         'entry_uuid': ice_entry.uuid,
                     })
 
     def updated_wrong_hostname_link(self, ice_entry, experiment_link):
-        self._existing_links_processed += 1
-        self._wrong_hostname_links_updated += 1
+        self._link_outcomes[UPDATED_WRONG_HOSTNAME_OUTCOME] += 1
 
         logger.info('Updated wrong hostname link %(link_url)s from ICE entry %(part_number)s '
-                    '(uuid %(entry_uuid)s)' % {
+                    '(uuid %(entry_uuid)s)', {
                         'part_number': ice_entry.part_id, 'link_url': experiment_link.url,
                         'entry_uuid': ice_entry.uuid,
                     })
 
     def found_orphaned_edd_strain(self, strain):
         logger.warning("EDD strain %(strain_pk)d has no UUID for the associated ICE entry. "
-                       "Skipping this incomplete strain." % {
+                       "Skipping this incomplete strain.", {
                            'strain_pk': strain.pk,
                        })
         self.processed_edd_strain(strain)  # no effect at present, but keep in case we change
@@ -569,10 +686,19 @@ class ProcessingSummary:
         self._stepchild_edd_strains.append(edd_strain)
         logger.warning("EDD strain %(strain_pk)d references an ICE entry that couldn't be found. "
                        "No ICE entry was found with uuid %(uuid)s . Skipping this strain (probably "
-                       "referenced from the wrong ICE instance)." % {
+                       "referenced from the wrong ICE instance).", {
                            'strain_pk': edd_strain.pk, 'uuid': edd_strain.registry_id,
                        })
 
+    def failed_edd_strain(self, edd_strain, attempts):
+        self._failed_edd_strains.append(edd_strain)
+        logger.exception('Giving up on EDD strain %(strain_pk)d (uuid %(uuid)s) after '
+                         '%(attempts)d failed processing attempts. Its ICE links may be '
+                         'partially maintained.', {
+                             'strain_pk': edd_strain.pk, 'uuid': edd_strain.registry_id,
+                             'attempts': attempts,
+                         })
+
     def found_non_strain_entry(self, edd_strain, ice_entry):
         self.processed_edd_strain(edd_strain)
         self._non_strain_ice_parts_referenced.append(ice_entry)
@@ -580,17 +706,17 @@ class ProcessingSummary:
         logger.warning('EDD *strain* %(edd_strain_pk)d references ICE entry "%(ice_entry_name)s", '
                        'but is defined as a %(entry_type)s. Links will be examined for this '
                        'part, but some manual curation is probably also required. ICE entry is '
-                       '%(part_number)s (uuid %(entry_uuid)s)' % {
+                       '%(part_number)s (uuid %(entry_uuid)s)', {
                            'edd_strain_pk': edd_strain.pk, 'ice_entry_name': ice_entry.name,
                            'entry_type': ice_entry.__class__.__name__,
                            'part_number': ice_entry.part_id, 'entry_uuid': ice_entry.uuid,
                        })
 
     def created_missing_link(self, ice_entry, study_url):
-        self._missing_links_created += 1
+        self._link_outcomes[CREATED_MISSING_LINK_OUTCOME] += 1
 
         logger.info('Created missing link %(link_url)s from ICE entry %(part_number)s '
-                    '(%(entry_uuid)s)' % {
+                    '(%(entry_uuid)s)', {
                         'link_url': study_url, 'part_number': ice_entry.part_id,
                         'entry_uuid': ice_entry.uuid,
                     })
@@ -602,21 +728,23 @@ class ProcessingSummary:
     def processed_edd_strain(self, strain):
         if not strain.registry_id:
             return  # should be captured by orphaned strains...don't count it twice!
-        self._processed_edd_strain_uuids[strain.registry_id] = True
+        self._processed_edd_strain_uuids.add(strain.registry_id)
 
     @property
     def existing_links_processed(self):
-        return self._existing_links_processed
+        return (sum(self._link_outcomes.values()) -
+                self._link_outcomes[CREATED_MISSING_LINK_OUTCOME])
 
     @property
     def previously_processed_strains_skipped(self):
         return len(self._previously_processed_strains_skipped)
 
     def skipped_previously_processed_entry(self, uuid):
-        print('Already processed entry %s earlier in the run...skipping it' % uuid)
+        print('Already processed entry %s earlier in the run (or a prior one)...skipping it'
+              % uuid)
         if uuid in self._previously_processed_strains_skipped:
             logger.error('ICE entry has been skipped twice! This indicates a logic error.')
-        self._previously_processed_strains_skipped[uuid] = True
+        self._previously_processed_strains_skipped.add(uuid)
         self._total_ice_entries_processed += 1
 
     def print_edd_summary(self, space):
@@ -633,9 +761,8 @@ class ProcessingSummary:
         subsection_header = ('EDD strains (processed/found): %(strains_processed)s / '
                              '%(strains_found)s (%(percent_processed)0.2f%%)' % {
                                  'strains_processed':
-                                     locale.format('%d', self.total_edd_strains_processed,
-                                                   grouping=True),
-                                 'strains_found': locale.format('%d', found, grouping=True),
+                                     format(self.total_edd_strains_processed, ',d'),
+                                 'strains_found': format(found, ',d'),
                                  'percent_processed': percent_strains_processed,
                              })
         subsection_separator = '-'.rjust(len(subsection_header), '-')
@@ -644,49 +771,45 @@ class ProcessingSummary:
         print(subsection_separator)
 
         ############################################################
-        # build dictionaries mapping output row title -> value
+        # build lists of (output row title, value)
         ############################################################
-        follow_up_items = OrderedDict({
-            'Non-strain ICE entries referenced by EDD': locale.format('%d', len(
-                    self._non_strain_ice_parts_referenced), grouping=True),
-            "Orphaned EDD strains (don't reference an ICE entry)": locale.format('%d', len(
-                    self._orphaned_edd_strains), grouping=True),
-            "Stepchild EDD strains (reference a UUID not found in this ICE deployment)":
-                locale.format(
-                    '%d', len(self._stepchild_edd_strains), grouping=True)
-
-        })
+        follow_up_items = [
+            ('Non-strain ICE entries referenced by EDD', format(len(
+                    self._non_strain_ice_parts_referenced), ',d')),
+            ("Orphaned EDD strains (don't reference an ICE entry)", format(len(
+                    self._orphaned_edd_strains), ',d')),
+            ("Stepchild EDD strains (reference a UUID not found in this ICE deployment)",
+                format(len(self._stepchild_edd_strains), ',d')),
+            ("Strains that couldn't be processed (see log)",
+                format(len(self._failed_edd_strains), ',d')),
+        ]
         updated_edd_strain_text = bool(self._updated_edd_strain_text)
         if not updated_edd_strain_text:
-            follow_up_items["Strains whose name/desc. don't match ICE"] = locale.format('%d',
-                                len(self._edd_strains_w_different_text))
-
-        rollup_result_items = OrderedDict()
-        rollup_result_items['Strains with current links:'] = locale.format('%d', len(
-                self._up_to_date_strains))
-        rollup_result_items['Strains with one or more links maintained:'] = locale.format('%d', len(
-                self._strains_with_changes), grouping=True)
-        rollup_result_items['Known follow-up items:'] = locale.format('%d', len(
+            follow_up_items.append(("Strains whose name/desc. don't match ICE",
+                                    format(len(self._edd_strains_w_different_text), ',d')))
+
+        rollup_result_items = [
+            ('Strains with current links:', format(len(self._up_to_date_strains), ',d')),
+            ('Strains with one or more links maintained:', format(len(
+                self._strains_with_changes), ',d')),
+            ('Known follow-up items:', format(len(
                 self._non_strain_ice_parts_referenced) + len(self._orphaned_edd_strains) + len(
-                self._stepchild_edd_strains), grouping=True)
+                self._stepchild_edd_strains) + len(self._failed_edd_strains), ',d')),
+        ]
+        if self._prior_run_strains_skipped:
+            rollup_result_items.append(('Strains skipped (processed in a prior run):',
+                                        format(self._prior_run_strains_skipped, ',d')))
 
         ############################################################
         # compute column widths and print summary output
         ############################################################
-        main_title_col_width = max(len(title) for title in rollup_result_items.keys()) + space
-        main_value_col_width = max(len(value) for value in rollup_result_items) + space
-        for title, value in rollup_result_items.items():
-            aligned_title = title.ljust(main_title_col_width, fill_char)
-            print(fill_char.join((aligned_title, value.rjust(main_value_col_width, fill_char))))
+        main_widths = column_widths(rollup_result_items, space)
+        print_aligned_rows(rollup_result_items, widths=main_widths)
 
         ############################################################
-        # compute column widths and print follow-up items
+        # print follow-up items
         ############################################################
-        title_col_width = max(len(title) for title in follow_up_items.keys()) + space
-        value_col_width = max(len(value) for value in follow_up_items.values()) + space
-        for title, value in follow_up_items.items():
-            aligned_title = '\t%s' % title.ljust(title_col_width, fill_char)
-            print(fill_char.join((aligned_title, value.rjust(value_col_width, fill_char))))
+        print_aligned_rows(follow_up_items, space=space, indent='\t')
 
         ############################################################
         # strains updated from ICE (print last since this overlaps with other items that
@@ -694,9 +817,8 @@ class ProcessingSummary:
         ############################################################
         if updated_edd_strain_text:
             title = 'Strains with name/desc. updated to match ICE'
-            aligned_title = title.ljust(main_title_col_width, fill_char)
             value = str(len(self._updated_edd_strain_text))
-            print(fill_char.join((aligned_title, value.rjust(main_value_col_width, fill_char))))
+            print_aligned_rows([(title, value)], widths=main_widths)
 
     def print_summary(self):
         did_processing = self.total_edd_strains_processed or self.total_ice_entries_processed
@@ -749,9 +871,8 @@ class ProcessingSummary:
         subsection_header = ('ICE entries (processed/found): %(entries_processed)s / '
                              '%(entries_found)s (%(percent_processed)0.2f%%)' % {
                                  'entries_processed':
-                                     locale.format('%d', self.total_ice_entries_processed,
-                                                   grouping=True),
-                                 'entries_found': locale.format('%d', entries_found, grouping=True),
+                                     format(self.total_ice_entries_processed, ',d'),
+                                 'entries_found': format(entries_found, ',d'),
                                  'percent_processed': percent_processed,
                              })
         subsection_separator = '-'.rjust(len(subsection_header), '-')
@@ -763,7 +884,7 @@ class ProcessingSummary:
         print('ICE entries %s scanned independently of those referenced from EDD' % scanned)
         if scanned_ice_entries:
             print('Previously-processed EDD strains skipped during ICE entry scan: %s' %
-                  locale.format('%d', self.previously_processed_strains_skipped))
+                  format(self.previously_processed_strains_skipped, ',d'))
 
         print('')
         subsection_header = 'ICE experiment link processing:'
@@ -772,48 +893,30 @@ class ProcessingSummary:
         print(subsection_header)
         print(subsection_separator)
 
-        first_level_summary = OrderedDict()
-        first_level_summary['Missing EDD links created'] = (
-            locale.format('%d', self._missing_links_created, grouping=True))
-        first_level_summary['Existing links processed'] = (
-            locale.format('%d', self._existing_links_processed, grouping=True))
-        title_col_width = max(len(title) for title in first_level_summary.keys()) + space
-        value_col_width = max(len(value) for value in first_level_summary.values()) + space
-        for title, value_str in first_level_summary.items():
-            aligned_title = title.ljust(title_col_width, fill_char)
-            print(fill_char.join((aligned_title, value_str.rjust(value_col_width, fill_char))))
+        first_level_summary = [
+            ('Missing EDD links created', format(
+                self._link_outcomes[CREATED_MISSING_LINK_OUTCOME], ',d')),
+            ('Existing links processed', format(self.existing_links_processed, ',d')),
+        ]
+        print_aligned_rows(first_level_summary, space=space)
 
         ############################################################################################
-        # build a dict of other results to be displayed so we can justify them in columns for
+        # build a list of other results to be displayed so we can justify them in columns for
         # printing
-        links_processed = OrderedDict()
-        links_processed['Unmaintained links renamed'] = locale.format(
-                '%d', self._unmaintained_links_renamed, grouping=True)
-        links_processed['Perl-style links updated'] = locale.format(
-                '%d', self._perl_links_updated, grouping=True)
-        links_processed['Wrong hostname links updated'] = locale.format(
-                '%d', self._wrong_hostname_links_updated, grouping=True)
-        links_processed['Invalid links pruned'] = locale.format(
-                '%d', self._invalid_links_pruned, grouping=True)
-        links_processed['Development links pruned'] = locale.format(
-                '%d', self._development_links_pruned, grouping=True)
-        links_processed['Test links pruned'] = locale.format(
-                '%d', self._test_links_pruned, grouping=True)
-        links_processed['Valid links skipped'] = locale.format(
-                '%d', self._valid_links_skipped, grouping=True)
-        links_processed['External or malformed links skipped'] = locale.format(
-                '%d', self._skipped_external_links, grouping=True)
-        links_processed['Duplicate links removed'] = locale.format(
-                '%d', self._duplicate_links_removed, grouping=True)
-
-        # compute column widths
-        sub_title_col_width = max(len(title) for title in links_processed.keys()) + space
-        sub_value_col_width = max(len(digits) for digits in links_processed.values()) + space
-
-        # print output
-        for title, count_str in links_processed.items():
-            aligned_title = '\t\t%s' % title.ljust(sub_title_col_width, fill_char)
-            print(''.join((aligned_title, count_str.rjust(sub_value_col_width, fill_char))))
+        links_processed = [
+            ('Unmaintained links renamed', RENAMED_UNMAINTAINED_LINK_OUTCOME),
+            ('Perl-style links updated', UPDATED_PERL_URL_OUTCOME),
+            ('Wrong hostname links updated', UPDATED_WRONG_HOSTNAME_OUTCOME),
+            ('Invalid links pruned', REMOVED_BAD_STUDY_LINK),
+            ('Development links pruned', REMOVED_DEVELOPMENT_URL_OUTCOME),
+            ('Test links pruned', REMOVED_TEST_URL_OUTCOME),
+            ('Valid links skipped', SKIPPED_VALID_LINK_OUTCOME),
+            ('External or malformed links skipped', SKIPPED_EXTERNAL_LINK_OUTCOME),
+            ('Duplicate links removed', REMOVED_DUPLICATE_STUDY_LINK),
+        ]
+        print_aligned_rows([(title, format(self._link_outcomes[outcome], ',d'))
+                            for title, outcome in links_processed],
+                           space=space, indent='\t\t', separator='')
 
 
 def print_shared_entry_processing_summary(entry, initial_entry_experiment_links_count,
@@ -855,6 +958,28 @@ def parse_int_or_uuid_arg(arg_value):
                                      'XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX' % arg_value)
 
 
+def read_processed_strains(resume_file):
+    """
+    Reads the UUIDs of strains processed during a prior run from the resume file, if it exists.
+    :return: a list of strain UUIDs, empty if there's no resume file yet
+    """
+    if not os.path.exists(resume_file):
+        return []
+    with open(resume_file) as input_file:
+        return json.load(input_file)
+
+
+def write_processed_strains(resume_file, strain_uuids):
+    """
+    Writes the UUIDs of all strains processed so far to the resume file. The file is replaced
+    in a single step, so an interruption during the write won't lose progress from prior runs.
+    """
+    temp_file = '%s.tmp' % resume_file
+    with open(temp_file, 'w') as output_file:
+        json.dump(sorted(strain_uuids), output_file)
+    os.replace(temp_file, resume_file)
+
+
 def main():
     """
     Executes the script
@@ -938,6 +1063,14 @@ def main():
                                               'for the connected EDD instance, regardless of the '
                                               'URL we use to access it')
 
+    parser.add_argument('-resume_file',
+                        help='the optional path to a file that tracks EDD strains whose ICE '
+                             'links have already been maintained. If the file exists, strains '
+                             'listed in it are skipped by both the EDD and ICE scans, and it\'s '
+                             'updated with the strains processed in this run, so an interrupted '
+                             'run can pick up where it left off. Delete the file to start over. '
+                             'Dry runs read the file but never update it.')
+
     parser.add_argument('-test_edd_strain_limit', type=int,
                         help='the maximum number of EDD strains to scan')
     parser.add_argument('-test_ice_entry_limit', type=int,
@@ -982,6 +1115,9 @@ def main():
         print('\t\tDry run: Yes')
     if args.test_edd_url:
         print('\t\tTest EDD Link Target URL:\t%s' % args.test_edd_url)
+    if args.resume_file:
+        print('\t\tResume file:\t%s%s' % (args.resume_file,
+                                            ' (read only)' if args.dry_run else ''))
     if args.test_edd_strain_limit:
         print('\t\tTest EDD Strain Limit:\t%s' % args.test_edd_strain_limit)
     if args.test_ice_entry_limit:
@@ -991,6 +1127,8 @@ def main():
 
     overall_performance = Performance()
     processing_summary = ProcessingSummary()
+    if perform_scans and args.resume_file:
+        processing_summary.resumed_prior_run(read_processed_strains(args.resume_file))
 
     user_input = UserInputTimer()
     edd = None
@@ -1027,7 +1165,7 @@ def main():
     if args.dry_run:
         if args.no_warn:
             logger.warning('Proceeding with potentially risky dry-run (confirmation '
-                           'prompt silenced via %s)' % no_warn_param_name)
+                           'prompt silenced via %s)', no_warn_param_name)
         else:
             print("WARNING: RISKY OPERATION!!! You've requested a dry run of this script, "
                   "but the dry run feature depends on proper maintenance of test stub classes "
@@ -1042,22 +1180,15 @@ def main():
             if not ('y' == reply or 'yes' == reply):
                 return 0
 
-    # build URL patterns
-
     # Set experiment link target URL for EDD. For testing, it may be different than the URL we're
     # connected to. Allows for local testing against a copy of the production EDD database without
     # risking any changes to production.
-    edd_link_target_hostname = urlparse(EDD_URL).hostname if not args.test_edd_url else \
-        urlparse(args.test_edd_url).hostname
-
-    perl_study_url_pattern = build_perl_study_url_pattern(edd_link_target_hostname)
-    study_url_pattern = build_study_url_pattern(edd_link_target_hostname)
+    edd_link_target_hostname = _hostname(args.test_edd_url or EDD_URL)
 
     # package up inputs that determine how processing is performed. There are too
     #  many / they change too often during development to pass around individually as method
     # parameters
-    processing_inputs = ProcessingInputs(study_url_pattern=study_url_pattern,
-                                         perl_study_url_pattern=perl_study_url_pattern,
+    processing_inputs = ProcessingInputs(edd_link_target_hostname=edd_link_target_hostname,
                                          test_edd_base_url=args.test_edd_url,
                                          cleaning_edd_test_instance=cleaning_edd_test_instance,
                                          cleaning_ice_test_instance=cleaning_ice_test_instance,
@@ -1083,6 +1214,9 @@ def main():
         edd.write_enabled = args.update_edd_strain_text
         edd.result_limit = EDD_RESULT_PAGE_SIZE
         edd.timeout = EDD_REQUEST_TIMEOUT
+        # keep enough connections alive for concurrent requests, and retry transient errors
+        mount_retrying_adapter(edd.session, REQUEST_POOL_SIZE, REQUEST_POOL_SIZE,
+                               REQUEST_MAX_RETRIES, REQUEST_RETRY_BACKOFF_FACTOR)
         processing_inputs.edd = edd
 
         # TODO: consider adding a REST API resource & use it to test whether this user
@@ -1106,11 +1240,14 @@ def main():
         edd_login_details.password = None
         ice_login_details.password = None
 
-        ice = (IceApi(ice_session_auth, ICE_URL, result_limit=ICE_RESULT_PAGE_SIZE,
-                      verify_ssl_cert=VERIFY_ICE_CERT) if not args.dry_run
-               else
-               IceTestStub(ice_session_auth, ICE_URL, result_limit=ICE_RESULT_PAGE_SIZE,
-                           verify_ssl_cert=VERIFY_ICE_CERT))
+        # entries and their links are read repeatedly while processing, so cache them briefly.
+        # IceApi configures its own connection pool, sized here for this script's threads
+        ice_class = IceApi if not args.dry_run else IceTestStub
+        ice = ice_class(ice_session_auth, ICE_URL, result_limit=ICE_RESULT_PAGE_SIZE,
+                        verify_ssl_cert=VERIFY_ICE_CERT, entry_cache_size=ENTRY_CACHE_SIZE,
+                        entry_cache_ttl=ENTRY_CACHE_TTL, pool_connections=REQUEST_POOL_SIZE,
+                        pool_maxsize=REQUEST_POOL_SIZE, max_retries=REQUEST_MAX_RETRIES,
+                        retry_backoff_factor=REQUEST_RETRY_BACKOFF_FACTOR)
         ice.write_enabled = True
         processing_inputs.ice = ice
         ice.timeout = ICE_REQUEST_TIMEOUT
@@ -1125,7 +1262,7 @@ def main():
         # scan all EDD strains, and possibly ICE entries, as configured
         if perform_scans:
             scan_edd_strains(processing_inputs, processing_summary, overall_performance)
-            overall_performance.ice_entry_scan_start_time = arrow.utcnow()
+            overall_performance.started_ice_entry_scan()
 
             # if configured, process entries in ICE that weren't just examined above.
             # This is probably only necessary during the initial few runs to correct for
@@ -1134,7 +1271,7 @@ def main():
                 scan_ice_entries(processing_inputs, args.include_entry_types,
                                  processing_summary)
                 overall_performance.ice_entry_scan_time = (
-                    arrow.utcnow() - overall_performance.ice_entry_scan_start_time)
+                    time.monotonic() - overall_performance.ice_entry_scan_start_time)
 
         # if specific EDD strain and/or ICE entry ID's were provided, only examine the
         # requested Things in lieu of an expensive scan
@@ -1167,14 +1304,22 @@ def main():
     except Exception as e:
         logger.exception('An error occurred')
     finally:
+        # save progress so a later run can skip strains processed so far. Strains are only
+        # simulated during a dry run, so a later real run mustn't skip them
+        if perform_scans and args.resume_file and not args.dry_run:
+            write_processed_strains(args.resume_file, processing_summary.processed_strain_uuids)
+
         print('')
         processing_summary.print_summary()
 
-        overall_performance.overall_end_time = arrow.utcnow()
+        overall_performance.overall_end_time = time.monotonic()
+        # read communication times, then release pooled connections to EDD / ICE
         if edd:
             overall_performance.edd_communication_time = edd.session.wait_time
+            edd.close()
         if ice:
             overall_performance.ice_communication_time = ice.session.wait_time
+            ice.close()
 
         print('')
         overall_performance.print_summary()
@@ -1197,61 +1342,227 @@ def scan_edd_strains(processing_inputs, processing_summary, overall_performance)
 
     tested_edd_strain_count = 0
     hit_test_limit = False
+    ice_lookup_pool = ThreadPoolExecutor(max_workers=ICE_ENTRY_PREFETCH_WORKERS)
+    ice_entry_futures = {}
 
-    # loop over EDD strains, processing a page of strains at a time
-    strains_page = edd.search_strains()
-    page_num = 1
-    while strains_page and strains_page.current_result_count:
-
-        print('EDD: received %(received)s of %(total)s strains (page %(page_num)s)' % {
-            'received': locale.format('%d', strains_page.current_result_count, grouping=True),
-            'total': locale.format('%d', strains_page.total_result_count, grouping=True),
-            'page_num': locale.format('%d', page_num, grouping=True),
-        })
+    # loop over EDD strains, processing a page of strains at a time. The next page is
+    # requested in the background while we process the current one.
+    def get_next_strains_page(strains_page, page_num):
+        if strains_page.is_paged() and strains_page.next_page:
+            return edd.search_strains(query_url=strains_page.next_page)
+        return None
 
-        if page_num == 1:
-            processing_summary.total_edd_strains_found = strains_page.total_result_count
-
-        # loop over strains in this results page, updating ICE's links to each one
-        for strain_index, edd_strain in enumerate(strains_page.results):
-            process_all_ice_entry_links = True
-            overall_result_index = float(edd.get_overall_result_index(strain_index, page_num))+1
-            scan_percent_when_complete = ((overall_result_index /
-                                          strains_page.total_result_count) * 100
-                                          if overall_result_index else 0)
-            process_edd_strain(edd_strain, processing_inputs, process_all_ice_entry_links,
-                               processing_summary, scan_percent_when_complete)
-
-            # enforce a small number of tested strains for starters so tests complete
-            # quickly
-            tested_edd_strain_count += 1
-            hit_test_limit = tested_edd_strain_count == test_edd_strain_limit
-            if hit_test_limit or is_aborted():
-                print('')
-                print('Hit test limit of %d EDD strains. Ending strain processing '
-                      'early.' % test_edd_strain_limit)
+    strains_pages = iter_result_pages(edd.search_strains(), get_next_strains_page)
+    try:
+        for page_num, strains_page in enumerate(strains_pages, start=1):
+            if not strains_page.current_result_count:
                 break
 
-        if hit_test_limit or is_aborted():
-            break
+            print('EDD: received %(received)s of %(total)s strains (page %(page_num)s)' % {
+                'received': format(strains_page.current_result_count, ',d'),
+                'total': format(strains_page.total_result_count, ',d'),
+                'page_num': format(page_num, ',d'),
+            })
 
-        # get another page of strains from EDD
-        if strains_page.is_paged() and strains_page.next_page:
-            strains_page = edd.search_strains(query_url=strains_page.next_page)
-            page_num += 1
-        else:
-            strains_page = None
+            if page_num == 1:
+                processing_summary.total_edd_strains_found = strains_page.total_result_count
+
+            # start concurrent lookups of the ICE entries referenced by strains in this page
+            # (bounded by the test limit, if any), then consume them in order below
+            page_strains = strains_page.results
+            if test_edd_strain_limit:
+                page_strains = page_strains[:test_edd_strain_limit - tested_edd_strain_count]
+            ice_entry_futures = prefetch_ice_entries(ice_lookup_pool, processing_inputs.ice,
+                                                     page_strains, processing_summary)
+
+            # loop over strains in this results page, updating ICE's links to each one
+            for strain_index, edd_strain in enumerate(strains_page.results):
+                # skip strains whose links were maintained in an interrupted run being resumed
+                if processing_summary.is_processed_in_prior_run(edd_strain.registry_id):
+                    processing_summary.skipped_prior_run_strain(edd_strain)
+                    continue
+
+                process_all_ice_entry_links = True
+                overall_result_index = float(edd.get_overall_result_index(strain_index, page_num))+1
+                scan_percent_when_complete = ((overall_result_index /
+                                              strains_page.total_result_count) * 100
+                                              if overall_result_index else 0)
+                ice_entry_future = ice_entry_futures.get(strain_index)
+
+                # retry strains that fail on connection errors or timeouts, rather than letting
+                # one dropped connection end a long scan. Other errors (e.g. 4xx responses) won't
+                # go away on retry, so the strain is just skipped. Either way, outcomes recorded by
+                # the failed attempt are discarded so they aren't counted twice.
+                for attempt in range(1, STRAIN_PROCESSING_ATTEMPTS + 1):
+                    checkpoint = processing_summary.checkpoint()
+                    try:
+                        process_edd_strain(edd_strain, processing_inputs,
+                                           process_all_ice_entry_links, processing_summary,
+                                           scan_percent_when_complete,
+                                           ice_entry_future=ice_entry_future)
+                        break
+                    except (requests.ConnectionError, requests.Timeout):
+                        processing_summary.rollback(checkpoint)
+                        if attempt == STRAIN_PROCESSING_ATTEMPTS:
+                            processing_summary.failed_edd_strain(edd_strain, attempt)
+                            break
+                        logger.warning('Error processing EDD strain %(strain_pk)d. Retrying '
+                                       '(attempt %(attempt)d of %(attempts)d)...', {
+                                           'strain_pk': edd_strain.pk, 'attempt': attempt + 1,
+                                           'attempts': STRAIN_PROCESSING_ATTEMPTS,
+                                       }, exc_info=True)
+                        time.sleep(0.5 * 2 ** attempt)
+
+                        # the prefetched lookup may be what failed, so look the entry up again
+                        ice_entry_future = None
+                    except RequestException:
+                        processing_summary.rollback(checkpoint)
+                        processing_summary.failed_edd_strain(edd_strain, attempt)
+                        break
+
+                # enforce a small number of tested strains for starters so tests complete
+                # quickly
+                tested_edd_strain_count += 1
+                hit_test_limit = tested_edd_strain_count == test_edd_strain_limit
+                if hit_test_limit or is_aborted():
+                    print('')
+                    print('Hit test limit of %d EDD strains. Ending strain processing '
+                          'early.' % test_edd_strain_limit)
+                    break
+
+            if hit_test_limit or is_aborted():
+                break
+    finally:
+        # abandon any page requests / lookups left over from an early exit or an error
+        strains_pages.close()
+        abandon_lookups(ice_lookup_pool, ice_entry_futures.values())
 
     overall_performance.completed_edd_strain_scan()
     if not hit_test_limit:
         print('')
     print('Done processing %(strain_count)d EDD strains in %(elapsed_time)s' % {
         'strain_count': processing_summary.total_edd_strains_processed,
-        'elapsed_time': to_human_relevant_delta(
-                overall_performance.edd_strain_scan_time.total_seconds())
+        'elapsed_time': to_human_relevant_delta(overall_performance.edd_strain_scan_time)
     })
 
 
+# marks the end of results passed from the producer thread in iter_result_pages()
+_END_OF_PAGES = object()
+
+
+def iter_result_pages(first_page, get_next_page, prefetch_count=2):
+    """
+    Iterates over pages of paged REST query results, requesting up to prefetch_count following
+    pages on a background thread so the network round trip for the next page overlaps with
+    processing of the current one. Errors from page requests are re-raised in the caller's thread.
+    Clients that stop iterating early should call close() on the returned generator to stop
+    the background requests.
+    :param first_page: the first PagedResult, or None if there are no results
+    :param get_next_page: a function that accepts a PagedResult and its 1-indexed page number,
+        and returns the next PagedResult, or None if there are no more pages
+    """
+    # skip the background thread entirely for the common case of a single page of results
+    if not (first_page and first_page.next_page):
+        if first_page:
+            yield first_page
+        return
+
+    pages = queue.Queue(maxsize=prefetch_count)
+    stopped = threading.Event()
+
+    def put(item):
+        # don't block forever if the consumer has stopped reading
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            page, page_num = first_page, 1
+            while page and put(page):
+                page = get_next_page(page, page_num)
+                page_num += 1
+        except Exception as e:
+            put(e)
+        put(_END_OF_PAGES)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            page = pages.get()
+            if page is _END_OF_PAGES:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        stopped.set()
+
+
+def abandon_lookups(executor, futures):
+    """
+    Shuts down an executor used to prefetch lookups without waiting for those still running, and
+    cancels those that haven't started yet. Equivalent to Python 3.9's
+    executor.shutdown(wait=False, cancel_futures=True), which isn't available in Python 3.7.
+    :param futures: the futures for lookups that may not have started yet
+    """
+    for future in futures:
+        future.cancel()
+    executor.shutdown(wait=False)
+
+
+def prefetch_ice_entries(executor, ice, edd_strains, processing_summary):
+    """
+    Starts concurrent lookups of the ICE entries referenced by a page of EDD strains, along with
+    their experiment links. Strain processing time is dominated by these ICE requests, so
+    starting them for the whole page keeps several strains' worth of requests in flight while
+    strains are processed one at a time (see look_up_ice_entry()).
+    :param executor: the executor used to perform the lookups
+    :param ice: the IceApi instance to query
+    :param edd_strains: the EDD strains whose ICE entries should be looked up
+    :param processing_summary: the summary of processing so far. Strains processed in a prior
+        run are omitted, since they'll be skipped.
+    :return: a dict of strain index -> Future for the result of look_up_ice_entry(). Orphaned
+        strains with no registry_id are omitted.
+    """
+    return {index: executor.submit(look_up_ice_entry, ice, edd_strain.registry_id)
+            for index, edd_strain in enumerate(edd_strains)
+            if edd_strain.registry_id and
+            not processing_summary.is_processed_in_prior_run(edd_strain.registry_id)}
+
+
+def look_up_ice_entry(ice, entry_uuid):
+    """
+    Looks up an ICE entry and, if it exists, builds the cache of its experiment links. Links
+    aren't requested for missing entries, since ICE responds with a 500 error instead of a 404.
+    :return: a tuple of (ICE entry, experiment links cache). Both are None if the entry wasn't
+        found.
+    """
+    ice_entry = ice.get_entry(entry_uuid)
+    if not ice_entry:
+        return None, None
+    return ice_entry, build_ice_entry_links_cache(ice, entry_uuid)
+
+
+def prefetch_edd_strains(executor, edd, ice_entries, processing_summary):
+    """
+    Starts concurrent lookups of the EDD strains matching a page of ICE entries.
+    :param executor: the executor used to perform the lookups
+    :param edd: the EddApi instance to query
+    :param ice_entries: the ICE entries whose matching EDD strains should be looked up
+    :param processing_summary: the summary of processing so far. Entries already processed
+        during the EDD strain scan are omitted, since they'll be skipped.
+    :return: a dict of entry index -> Future for the matching EDD strain, if any
+    """
+    return {index: executor.submit(edd.get_strain, entry.uuid)
+            for index, entry in enumerate(ice_entries)
+            if not processing_summary.is_edd_strain_processed(entry.uuid)}
+
+
 def scan_ice_entries(processing_inputs, search_ice_part_types, processing_summary):
     """
     Searches ICE for entries of the specified type(s), then examines experiment links for each part
@@ -1272,103 +1583,122 @@ def scan_ice_entries(processing_inputs, search_ice_part_types, processing_summar
     print('Comparing %s ICE entries to EDD... ' % entries_summary)
     print(OUTPUT_SEPARATOR)
 
-    search_results_page = ice.search_entries(entry_types=search_ice_part_types)
-    page_num = 1
+    first_results_page = ice.search_entries(entry_types=search_ice_part_types)
     tested_entry_count = 0
     hit_test_limit = False
+    edd_lookup_pool = ThreadPoolExecutor(max_workers=ICE_ENTRY_PREFETCH_WORKERS)
+    edd_strain_futures = {}
+
+    # request the next page of results (if any) in the background while processing the
+    # current one
+    def get_next_results_page(results_page, page_num):
+        if results_page.is_paged() and results_page.next_page:
+            return ice.search_entries(entry_types=search_ice_part_types,
+                                      page_number=page_num + 1)
+        return None
 
     # loop over ICE entries, finding and pruning stale links to EDD strains / studies
     # that no longer reference them. We'll skip ICE entries that we just examined from
     # the EDD perspective above, since there's a low probability they've been updated since
-    while search_results_page and search_results_page.current_result_count:
-        print('ICE: received %(received)s of %(total)s entries (page %(page_num)s)' % {
-            'received': locale.format('%d', search_results_page.current_result_count,
-                                      grouping=True),
-            'total': locale.format('%d', search_results_page.total_result_count, grouping=True),
-            'page_num': locale.format('%d', page_num, grouping=True)
-        })
-
-        if page_num == 1:
-            processing_summary.total_ice_entries_found = search_results_page.total_result_count
-        elif search_results_page.total_result_count != processing_summary.total_ice_entries_found:
-            total_entries_found = processing_summary.total_ice_entries_found
-            logger.warning('Search result total for page %(page_num)s (%(new_total)s)is different '
-                           'from the total reflected by page 1 (%(initial_total)s. It appears that '
-                           'some entries have been added or removed while this script was '
-                           'running' % {
-                               'page_num': locale.format('%d', page_num, grouping=True),
-                               'initial_total': locale.format('%d', total_entries_found,
-                                                              grouping=True),
-                               'new_total': locale.format('%d',
-                                                          search_results_page.total_result_count,
-                                                          grouping=True)
-                           })
-
-        # loop over ICE entries in the current results page
-        for result_index, search_result in enumerate(search_results_page.results):
-            entry = search_result.entry
-
-            print('')
-            subheading = 'Processing ICE entry %(part_number)s (uuid %(uuid)s)...' % {
-                'part_number': entry.part_id, 'uuid': entry.uuid,
-            }
-            separator = '-'.ljust(len(subheading), '-')
-            print(separator)
-            print(subheading)
-            print(separator)
-
-            print('Entry %(result_num)s of %(page_size)s in results page %(page_num)s.' % {
-                    'result_num': locale.format('%d', result_index + 1, grouping=True),
-                    'page_size': locale.format('%d', search_results_page.current_result_count,
-                                               grouping=True),
-                    'page_num': locale.format('%d', page_num, grouping=True),
+    search_results_pages = iter_result_pages(first_results_page, get_next_results_page)
+    try:
+        for page_num, search_results_page in enumerate(search_results_pages, start=1):
+            if not search_results_page.current_result_count:
+                break
+            print('ICE: received %(received)s of %(total)s entries (page %(page_num)s)' % {
+                'received': format(search_results_page.current_result_count, ',d'),
+                'total': format(search_results_page.total_result_count, ',d'),
+                'page_num': format(page_num, ',d')
             })
 
-            overall_result_index = float(ice.get_overall_result_index(result_index, page_num))
-            scan_percent_when_complete = ((
-                                     overall_result_index /
-                                     search_results_page.total_result_count) * 100 if
-                                     overall_result_index else 0)
-
-            # skip entries that we just processed when examining EDD strains. Possible these
-            # relationships have changed since our pass through EDD, but most likely that
-            # nothing has changed or that EDD properly maintained the ICE links in the interim
-            if processing_summary.is_edd_strain_processed(entry.uuid):
-                processing_summary.skipped_previously_processed_entry(entry.uuid)
-                print_ice_scan_completion(scan_percent_when_complete)
-                continue
-
-            process_ice_entry(entry, processing_inputs, processing_summary,
-                              scan_percent_when_complete=scan_percent_when_complete)
-            tested_entry_count += 1
+            if page_num == 1:
+                processing_summary.total_ice_entries_found = search_results_page.total_result_count
+            elif (search_results_page.total_result_count !=
+                  processing_summary.total_ice_entries_found):
+                total_entries_found = processing_summary.total_ice_entries_found
+                logger.warning('Search result total for page %(page_num)s (%(new_total)s)is '
+                               'different from the total reflected by page 1 (%(initial_total)s. '
+                               'It appears that some entries have been added or removed while '
+                               'this script was running', {
+                                   'page_num': format(page_num, ',d'),
+                                   'initial_total': format(total_entries_found, ',d'),
+                                   'new_total': format(search_results_page.total_result_count, ',d')
+                               })
+
+            # start concurrent lookups of the EDD strains matching entries in this page (bounded
+            # by the test limit, if any), then consume them in order below
+            page_entries = [search_result.entry for search_result in search_results_page.results]
+            if test_entry_limit:
+                page_entries = page_entries[:test_entry_limit - tested_entry_count]
+            edd_strain_futures = prefetch_edd_strains(edd_lookup_pool, processing_inputs.edd,
+                                                      page_entries, processing_summary)
+
+            # loop over ICE entries in the current results page
+            for result_index, search_result in enumerate(search_results_page.results):
+                entry = search_result.entry
 
-            hit_test_limit = tested_entry_count == test_entry_limit
+                print('')
+                subheading = 'Processing ICE entry %(part_number)s (uuid %(uuid)s)...' % {
+                    'part_number': entry.part_id, 'uuid': entry.uuid,
+                }
+                separator = '-'.ljust(len(subheading), '-')
+                print(separator)
+                print(subheading)
+                print(separator)
+
+                print('Entry %(result_num)s of %(page_size)s in results page %(page_num)s.' % {
+                        'result_num': format(result_index + 1, ',d'),
+                        'page_size': format(search_results_page.current_result_count, ',d'),
+                        'page_num': format(page_num, ',d'),
+                })
+
+                overall_result_index = float(ice.get_overall_result_index(result_index, page_num))
+                scan_percent_when_complete = ((
+                                         overall_result_index /
+                                         search_results_page.total_result_count) * 100 if
+                                         overall_result_index else 0)
+
+                # skip entries that we just processed when examining EDD strains. Possible these
+                # relationships have changed since our pass through EDD, but most likely that
+                # nothing has changed or that EDD properly maintained the ICE links in the interim
+                if processing_summary.is_edd_strain_processed(entry.uuid):
+                    processing_summary.skipped_previously_processed_entry(entry.uuid)
+                    print_ice_scan_completion(scan_percent_when_complete)
+                    continue
+
+                process_ice_entry(entry, processing_inputs, processing_summary,
+                                  scan_percent_when_complete=scan_percent_when_complete,
+                                  edd_strain_future=edd_strain_futures.get(result_index))
+                tested_entry_count += 1
+
+                hit_test_limit = tested_entry_count == test_entry_limit
+
+                if hit_test_limit:
+                    print("Hit test limit of %d ICE entries. Ending ICE entry processing early." %
+                          tested_entry_count)
+                    break
 
             if hit_test_limit:
-                print("Hit test limit of %d ICE entries. Ending ICE entry processing early." %
-                      tested_entry_count)
                 break
+    finally:
+        # abandon any page requests / lookups left over from an early exit or an error
+        search_results_pages.close()
+        abandon_lookups(edd_lookup_pool, edd_strain_futures.values())
 
-        if hit_test_limit:
-            break
-
-        # if available, get another page of results
-        if search_results_page.is_paged() and search_results_page.next_page:
-            page_num += 1
-            search_results_page = ice.search_entries(entry_types=search_ice_part_types,
-                                                     page_number=page_num)
-
-    if not search_results_page:
+    if not first_results_page:
         logger.warning("Didn't find any ICE parts in the search")
 
 
 def process_ice_entry(entry, processing_inputs, processing_summary,
-                      scan_percent_when_complete=None):
+                      scan_percent_when_complete=None, edd_strain_future=None):
     """
     Processes a single ICE entry, checking its experiment links and creating / maintaining any
     included links to EDD.
+    :param edd_strain_future: an optional Future for a previously-started lookup of the EDD
+        strain matching this entry (see prefetch_edd_strains()). If None, the strain is looked up
+        here.
     """
-    start_time = arrow.utcnow()
+    start_time = time.monotonic()
     ice = processing_inputs.ice
     edd = processing_inputs.edd
 
@@ -1376,12 +1706,15 @@ def process_ice_entry(entry, processing_inputs, processing_summary,
     # checks a single ICE entry, and if this is part of a longer run (an ICE scan following an EDD
     # scan), it's good to double-check since several tens of minutes may have passed since we
     # scanned EDD
-    edd_strain = edd.get_strain(entry.uuid)
+    if edd_strain_future is not None:
+        edd_strain = edd_strain_future.result()
+    else:
+        edd_strain = edd.get_strain(entry.uuid)
     preexisting_entry_links_dict = {}
 
     # if this entry matches an EDD strain, maintain its links against EDD
     if edd_strain:
-        strain_performance = StrainProcessingPerformance(edd_strain, arrow.utcnow(),
+        strain_performance = StrainProcessingPerformance(edd_strain, time.monotonic(),
                                                          edd.session.wait_time,
                                                          ice.session.wait_time)
 
@@ -1400,20 +1733,18 @@ def process_ice_entry(entry, processing_inputs, processing_summary,
         preexisting_entry_links_dict = build_ice_entry_links_cache(ice, entry.uuid)
 
         # remove all EDD links from this entry, if any
-        for url, experiment_link in preexisting_entry_links_dict.items():
-            perl_link_pattern = processing_inputs.perl_study_url_pattern
-            study_url_pattern = processing_inputs.study_url_pattern
-            if (study_url_pattern.match(url) or perl_link_pattern.match(url) or
-                    WRONG_HOSTNAME_PATTERN.match(url)):
+        edd_link_pattern = processing_inputs.edd_link_pattern
+        edd_links = [experiment_link for url, experiment_link in
+                     preexisting_entry_links_dict.items() if edd_link_pattern.fullmatch(url)]
 
-                # TODO: SYNBIO-1350: use entry.uuid after prerequisite SYNBIO-1207 is complete.
-                ice.remove_experiment_link(entry.uuid, experiment_link.id)
+        # TODO: SYNBIO-1350: use entry.uuid after prerequisite SYNBIO-1207 is complete.
+        ice.remove_experiment_links(entry.uuid, [link.id for link in edd_links])
 
     processing_summary.total_ice_entries_processed += 1
-    run_duration = arrow.utcnow() - start_time
+    run_duration = time.monotonic() - start_time
     preexisting_links_count = len(preexisting_entry_links_dict)
     print_shared_entry_processing_summary(entry, preexisting_links_count,
-                                          run_duration.total_seconds())
+                                          run_duration)
 
     if scan_percent_when_complete is not None:
         print_ice_scan_completion(scan_percent_when_complete)
@@ -1442,27 +1773,20 @@ def build_ice_entry_links_cache(ice, entry_uuid):
       :returns a map of lower-case link url -> ExperimentLink for all links associated with this
       entry
     """
-    all_experiment_links = {}
-
-    results_page = ice.get_entry_experiments(entry_uuid)
-    while results_page and not is_aborted():
-        for link in results_page.results:
-            all_experiment_links[link.url.lower()] = link
+    if is_aborted():
+        return {}
 
-        # get another page of results
-        if results_page.next_page:
-            results_page = ice.get_entry_experiments(query_url=results_page.next_page)
-        else:
-            results_page = None
-
-    return all_experiment_links
+    # remaining pages of links, if any, are requested concurrently after the first
+    return {link.url.lower(): link for link in ice.get_all_entry_experiments(entry_uuid)}
 
 
 class ProcessingInputs(object):
-    def __init__(self, study_url_pattern, perl_study_url_pattern, test_edd_base_url,
+    def __init__(self, edd_link_target_hostname, test_edd_base_url,
                  cleaning_edd_test_instance, cleaning_ice_test_instance, test_edd_strain_limit,
                  test_ice_entry_limit, update_edd_strain_text):
         """
+        :param edd_link_target_hostname: the hostname of the EDD instance whose links are being
+        maintained. Link patterns for the host are compiled once here for reuse.
         :param cleaning_ice_test_instance: true if the ICE instance being maintained is a test
         instance. If False, all reverences to EDD test instances will be removed on the assumption
          that they were accidental artifacts of software testing with improperly configured URLs.
@@ -1470,8 +1794,8 @@ class ProcessingInputs(object):
         self.edd = None
         self.ice = None
         self.scan_ice_entries = scan_ice_entries
-        self.study_url_pattern = study_url_pattern
-        self.perl_study_url_pattern = perl_study_url_pattern
+        self.edd_link_target_hostname = edd_link_target_hostname
+        self.edd_link_pattern = build_edd_link_pattern(edd_link_target_hostname)
         self.test_edd_base_url = test_edd_base_url
         self.cleaning_edd_test_instance = cleaning_edd_test_instance
         self.cleaning_ice_test_instance = cleaning_ice_test_instance
@@ -1479,6 +1803,34 @@ class ProcessingInputs(object):
         self.test_ice_entry_limit = test_ice_entry_limit
         self.update_edd_strain_text = update_edd_strain_text
 
+        # lower-case current / dated study URLs, cached by study pk. Many strains are used in
+        # the same studies, so the same URLs would otherwise be rebuilt for every strain
+        self._study_urls = {}
+        self._dated_study_urls = {}
+
+    def study_url(self, study_pk):
+        """
+        Gets the lower-case absolute URL for the EDD study with the provided primary key,
+        using the test EDD base URL if one was provided.
+        """
+        study_url = self._study_urls.get(study_pk)
+        if study_url is None:
+            study_url = self.edd.get_abs_study_browser_url(
+                study_pk, alternate_base_url=self.test_edd_base_url).lower()
+            self._study_urls[study_pk] = study_url
+        return study_url
+
+    def dated_study_urls(self, study_pk):
+        """
+        Gets the known lower-case variations of dated URLs for the EDD study with the provided
+        primary key (see build_dated_url_variations()).
+        """
+        dated_urls = self._dated_study_urls.get(study_pk)
+        if dated_urls is None:
+            dated_urls = build_dated_url_variations(study_pk, self)
+            self._dated_study_urls[study_pk] = dated_urls
+        return dated_urls
+
 
 def build_dated_url_variations(study_pk, processing_inputs):
     """
@@ -1491,13 +1843,11 @@ def build_dated_url_variations(study_pk, processing_inputs):
     """
     # look for an unmaintained link to the study URL from the older
     # perl version of EDD (these exist!). If found, update it.
-    alternate_base_url = processing_inputs.test_edd_base_url
-    link_target_hostname = urlparse(
-            alternate_base_url).hostname if alternate_base_url else urlparse(EDD_URL).hostname
+    link_target_hostname = processing_inputs.edd_link_target_hostname
 
-    # Perl-style links
+    # Perl-style links. Only the scheme differs between them, so lower-case the shared part once
     perl_http_study_url = build_perl_study_url(study_pk, link_target_hostname).lower()
-    perl_https_study_url = build_perl_study_url(study_pk, link_target_hostname, https=True).lower()
+    perl_https_study_url = 'https' + perl_http_study_url[len('http'):]
 
     # wrong hostname link (we only need one protocol variation here since data was only present
     # for a short time)
@@ -1507,7 +1857,8 @@ def build_dated_url_variations(study_pk, processing_inputs):
 
 
 def process_matching_strain(edd_strain, ice_entry, process_all_ice_entry_links,
-                            processing_inputs, processing_summary, strain_performance):
+                            processing_inputs, processing_summary, strain_performance,
+                            ice_entry_links=None):
     """
     Compares matching EDD strains and ICE entries, updating the ICE strain's experiment links to
     reference studies where the strain is used in EDD.
@@ -1518,6 +1869,8 @@ def process_matching_strain(edd_strain, ice_entry, process_all_ice_entry_links,
     :param processing_inputs: processing inputs. Many / variable contents during development
     :param processing_summary: the processing summary for this script
     :param strain_performance: tracks performance in updating this strain
+    :param ice_entry_links: an optional, previously-built cache of the ICE entry's experiment
+        links (see look_up_ice_entry()). If None, the cache is built here.
     :return:
     """
     edd = processing_inputs.edd
@@ -1526,9 +1879,24 @@ def process_matching_strain(edd_strain, ice_entry, process_all_ice_entry_links,
     # build a cache of all experiment links from this ICE entry. The cache should be fairly
     # short-lived, so unlikely to create race conditions
     ice_entry_uuid = edd_strain.registry_id
-    all_strain_experiment_links = build_ice_entry_links_cache(ice, ice_entry_uuid)
-    strain_performance.ice_link_search_time = (arrow.utcnow() - strain_performance.start_time)
-    unprocessed_strain_experiment_links = all_strain_experiment_links.copy()
+    if ice_entry_links is not None:
+        all_strain_experiment_links = ice_entry_links
+    else:
+        all_strain_experiment_links = build_ice_entry_links_cache(ice, ice_entry_uuid)
+    strain_performance.ice_link_search_time = (time.monotonic() - strain_performance.start_time)
+
+    # lower-case URLs of links examined while comparing against this strain's studies
+    processed_link_urls = set()
+
+    # dated links (Perl-style or wrong hostname) are legacy data, and rare. Check for them once
+    # here so the study loop can skip looking up each study's dated URLs if there aren't any
+    edd_link_pattern = processing_inputs.edd_link_pattern
+    has_dated_links = False
+    for link_url in all_strain_experiment_links:
+        link_match = edd_link_pattern.fullmatch(link_url)
+        if link_match and link_match.lastgroup != STUDY_LINK:
+            has_dated_links = True
+            break
 
     # detect whether the EDD/ICE strain names & descriptions match. If not, conditionally apply
     # those in ICE to EDD, since EDD strains should be derived from those in ICE
@@ -1551,134 +1919,149 @@ def process_matching_strain(edd_strain, ice_entry, process_all_ice_entry_links,
 
     # query EDD for all studies that reference this strain
     changed_links = False
-    strain_studies_page = edd.get_strain_studies(edd_strain.pk) if not is_aborted() else None
-    while strain_studies_page and not is_aborted():
-
-        for study in strain_studies_page.results:
-            existing_valid_study_links = {}
-            found_dated_urls = {}
-
-            # if is_aborted(): # TODO: consider re-adding if we can't use Celery's AbortableTask,
-            # and therefore don't have to worry about the performance hit for testing aborted
-            # status
-            #       break
-
-            alternate_base_url = processing_inputs.test_edd_base_url
-            study_url = edd.get_abs_study_browser_url(study.pk,
-                                                      alternate_base_url=alternate_base_url).lower()
-            strain_to_study_link = all_strain_experiment_links.get(study_url)
-            unprocessed_strain_experiment_links.pop(study_url, None)
-
-            # if no up-to-date link was found to this EDD study, find all links to the study
-            # that are using dated URL schemes, then update or remove them as appropriate.
-            if not strain_to_study_link:
-                dated_url_variations = build_dated_url_variations(study.pk, processing_inputs)
-
-                for dated_url_variant in dated_url_variations:
-                    dated_link = unprocessed_strain_experiment_links.pop(dated_url_variant, None)
-
-                    # if we found a dated link, update it to use EDD's new URL scheme
-                    if dated_link:
-
-                        found_dated_urls[dated_url_variant] = dated_link
-
-                        # updated only the first dated URL that refers to this study. If updated,
-                        # others would be duplicates, so we'll remove them.
-                        if len(found_dated_urls) == 1:
-                            old_study_name = (dated_link.label if dated_link else None)
-
-                            # TODO: possible optimization here...this method was written on the
-                            # assumption that no prior processing was performed,
-                            # so it's re-querying/checking the existing ICE links that we just
-                            # cached. Used in multiple places in this script, though during
-                            # testing, ICE communication during the scan is by far the biggest
-                            # offender in terms of execution time when the ICE scan is performed.
-                            # TODO: SYNBIO-1350: use entry.uuid to remove workaround after
-                            # prerequisite SYNBIO-1207 is complete.
-                            workaround_ice_id = ice_entry.id
-                            ice.link_entry_to_study(workaround_ice_id, study.pk, study_url,
-                                                    study.name, old_study_name=old_study_name,
-                                                    old_study_url=dated_link.url, logger=logger)
-                            if processing_inputs.perl_study_url_pattern.match(dated_url_variant):
-                                processing_summary.updated_perl_link(ice_entry, dated_link)
-                            elif WRONG_HOSTNAME_PATTERN.match(dated_url_variant):
-                                processing_summary.updated_wrong_hostname_link(ice_entry,
-                                                                               dated_link)
+    # the next page of studies (if any) is requested in the background while processing the
+    # current one
+    def get_next_studies_page(studies_page, page_num):
+        if studies_page.next_page:
+            return edd.get_strain_studies(query_url=studies_page.next_page)
+        return None
+
+    first_studies_page = edd.get_strain_studies(edd_strain.pk) if not is_aborted() else None
+    strain_studies_pages = iter_result_pages(first_studies_page, get_next_studies_page)
+    try:
+        for strain_studies_page in strain_studies_pages:
+            if is_aborted():
+                break
+
+            for study in strain_studies_page.results:
+                found_dated_urls = {}
+
+                # if is_aborted(): # TODO: consider re-adding if we can't use Celery's
+                # AbortableTask, and therefore don't have to worry about the performance hit for
+                # testing aborted status
+                #       break
+
+                study_url = processing_inputs.study_url(study.pk)
+                strain_to_study_link = all_strain_experiment_links.get(study_url)
+                processed_link_urls.add(study_url)
+
+                # if no up-to-date link was found to this EDD study, find all links to the study
+                # that are using dated URL schemes, then update or remove them as appropriate.
+                if has_dated_links and not strain_to_study_link:
+                    dated_url_variations = processing_inputs.dated_study_urls(study.pk)
+
+                    for dated_url_variant in dated_url_variations:
+                        dated_link = (all_strain_experiment_links.get(dated_url_variant)
+                                      if dated_url_variant not in processed_link_urls else None)
+                        processed_link_urls.add(dated_url_variant)
+
+                        # if we found a dated link, update it to use EDD's new URL scheme
+                        if dated_link:
+
+                            found_dated_urls[dated_url_variant] = dated_link
+
+                            # updated only the first dated URL that refers to this study. If
+                            # updated, others would be duplicates, so we'll remove them.
+                            if len(found_dated_urls) == 1:
+                                old_study_name = (dated_link.label if dated_link else None)
+
+                                # TODO: possible optimization here...this method was written on
+                                # the assumption that no prior processing was performed,
+                                # so it's re-querying/checking the existing ICE links that we
+                                # just cached. Used in multiple places in this script, though
+                                # during testing, ICE communication during the scan is by far the
+                                # biggest offender in terms of execution time when the ICE scan
+                                # is performed.
+                                # TODO: SYNBIO-1350: use entry.uuid to remove workaround after
+                                # prerequisite SYNBIO-1207 is complete.
+                                workaround_ice_id = ice_entry.id
+                                ice.link_entry_to_study(workaround_ice_id, study.pk, study_url,
+                                                        study.name, old_study_name=old_study_name,
+                                                        old_study_url=dated_link.url, logger=logger)
+                                dated_link_match = processing_inputs.edd_link_pattern.fullmatch(
+                                        dated_url_variant)
+                                dated_link_type = (dated_link_match.lastgroup if dated_link_match
+                                                   else None)
+                                if dated_link_type == PERL_STUDY_LINK:
+                                    processing_summary.updated_perl_link(ice_entry, dated_link)
+                                elif dated_link_type == WRONG_HOSTNAME_LINK:
+                                    processing_summary.updated_wrong_hostname_link(ice_entry,
+                                                                                   dated_link)
+                                else:
+                                    logger.warning(
+                                        'Updated dated link %s not captured in metrics',
+                                        dated_url_variant)
                             else:
-                                logger.warning(
-                                    'Updated dated link %s not captured in metrics' %
-                                    dated_url_variant)
-                        else:
-                            # TODO: SYNBIO-1350: use entry.uuid to remove workaround after
-                            # prerequisite SYNBIO-1207 is complete.
-                            workaround_ice_id = ice_entry.id
-                            ice.remove_experiment_link(workaround_ice_id, dated_link.id)
-                            processing_summary.removed_duplicate_link(ice_entry, dated_link)
-
-                        strain_performance.links_updated += 1
-                        changed_links = True
-
-                        # otherwise, track how many existing valid links we skipped over
-            if found_dated_urls:
-                continue
-
-            if strain_to_study_link and (strain_to_study_link.label == study.name):
-                        existing_valid_study_links[
-                            strain_to_study_link.url.lower()] = strain_to_study_link
-                        processing_summary.skipped_valid_link(ice_entry, strain_to_study_link)
-
-            # if no link to the study has been found, or if one exists with an unmaintained
-            # name, create / update the link
-            else:
-                old_study_name = strain_to_study_link.label if strain_to_study_link else None
-                ice.link_entry_to_study(ice_entry_uuid, study.pk, study_url, study.name, logger,
-                                        old_study_name)
-                if old_study_name:
-                    processing_summary.renamed_unmaintained_link(ice_entry, strain_to_study_link,
-                                                                 study.name)
-                else:
-                    processing_summary.created_missing_link(ice_entry, study_url)
-                changed_links = True
-                strain_performance.links_updated += 1
+                                # TODO: SYNBIO-1350: use entry.uuid to remove workaround after
+                                # prerequisite SYNBIO-1207 is complete.
+                                workaround_ice_id = ice_entry.id
+                                ice.remove_experiment_link(workaround_ice_id, dated_link.id)
+                                processing_summary.removed_duplicate_link(ice_entry, dated_link)
 
-        # get the next page (if any) of studies associated with this strain
-        if strain_studies_page.next_page:
-            strain_studies_page = edd.get_strain_studies(query_url=strain_studies_page.next_page)
-        else:
-            strain_studies_page = None
+                            strain_performance.links_updated += 1
+                            changed_links = True
+
+                            # otherwise, track how many existing valid links we skipped over
+                if found_dated_urls:
+                    continue
+
+                if strain_to_study_link and (strain_to_study_link.label == study.name):
+                    processing_summary.skipped_valid_link(ice_entry, strain_to_study_link)
+
+                # if no link to the study has been found, or if one exists with an unmaintained
+                # name, create / update the link
+                else:
+                    old_study_name = strain_to_study_link.label if strain_to_study_link else None
+                    ice.link_entry_to_study(ice_entry_uuid, study.pk, study_url, study.name, logger,
+                                            old_study_name)
+                    if old_study_name:
+                        processing_summary.renamed_unmaintained_link(ice_entry,
+                                                                     strain_to_study_link,
+                                                                     study.name)
+                    else:
+                        processing_summary.created_missing_link(ice_entry, study_url)
+                    changed_links = True
+                    strain_performance.links_updated += 1
+    finally:
+        # stop any background page request left over from an early exit or an error
+        strain_studies_pages.close()
 
     # look over ICE experiment links for this entry that we didn't add, update, or remove as a
     # result of up-to-date study/strain associations in EDD. If any remain that match the
     # pattern of EDD URL's, they're invalid and need to be removed. This complete processing
     # of the ICE entry's experiment links will also allow us to skip over this entry later
     # in the process if we scan ICE to look for other entries with outdated links to EDD
+    unprocessed_link_urls = [link_url for link_url in all_strain_experiment_links
+                             if link_url not in processed_link_urls]
     if process_all_ice_entry_links:
-        for link_url, experiment_link in unprocessed_strain_experiment_links.items():
+        invalid_links = []
+        for link_url in unprocessed_link_urls:
+            experiment_link = all_strain_experiment_links[link_url]
             # don't modify any experiment URL that doesn't directly map to
             # a known EDD URL. Researchers can create these manually, and we
             # don't want to remove any that EDD didn't create. Valid-but-dated EDD URL
             # patterns should  already have been handled above
-            study_url_pattern = processing_inputs.study_url_pattern
-            perl_study_url_pattern = processing_inputs.perl_study_url_pattern
-            invalid_edd_url_match = (study_url_pattern.match(experiment_link.url) or
-                                     perl_study_url_pattern.match(link_url) or
-                                     WRONG_HOSTNAME_PATTERN.match(link_url))
+            invalid_edd_url_match = processing_inputs.edd_link_pattern.fullmatch(link_url)
             if invalid_edd_url_match:
-                # TODO: SYNBIO-1350: use entry.uuid after prerequisite SYNBIO-1207 is complete.
-                workaround_ice_id = ice_entry.id
-                ice.remove_experiment_link(workaround_ice_id, experiment_link.id)
-                processing_summary.removed_invalid_link(ice_entry, experiment_link)
-                changed_links = True
+                invalid_links.append(experiment_link)
             else:
                 processing_summary.skipped_external_link(ice_entry, experiment_link)
-        unprocessed_strain_experiment_links.clear()
+
+        if invalid_links:
+            # TODO: SYNBIO-1350: use entry.uuid after prerequisite SYNBIO-1207 is complete.
+            workaround_ice_id = ice_entry.id
+            ice.remove_experiment_links(workaround_ice_id, [link.id for link in invalid_links])
+            for experiment_link in invalid_links:
+                processing_summary.removed_invalid_link(ice_entry, experiment_link)
+            changed_links = True
+        unprocessed_link_urls = []
     else:
-        runtime_seconds = (arrow.utcnow() - strain_performance.start_time).total_seconds()
-        if unprocessed_strain_experiment_links:
+        runtime_seconds = time.monotonic() - strain_performance.start_time
+        if unprocessed_link_urls:
             print('Skipped %d experiment links from the associated ICE part that did not '
-                  'reference this EDD strain' % len(unprocessed_strain_experiment_links))
+                  'reference this EDD strain' % len(unprocessed_link_urls))
             print_shared_entry_processing_summary(ice_entry, len(all_strain_experiment_links) - len(
-                    unprocessed_strain_experiment_links), runtime_seconds)
+                    unprocessed_link_urls), runtime_seconds)
         else:
             print("No experiment links found for this ICE entry that didn't reference this "
                   "EDD strain")
@@ -1690,22 +2073,25 @@ def process_matching_strain(edd_strain, ice_entry, process_all_ice_entry_links,
         processing_summary.found_edd_strain_with_up_to_date_links(edd_strain, ice_entry)
 
     # track performance for completed processing
-    strain_performance.ice_link_cache_lifetime = arrow.utcnow() - strain_performance.start_time
-    strain_performance.set_end_time(arrow.utcnow(), edd.session.wait_time,
+    strain_performance.ice_link_cache_lifetime = time.monotonic() - strain_performance.start_time
+    strain_performance.set_end_time(time.monotonic(), edd.session.wait_time,
                                     ice.session.wait_time)
     print_shared_entry_processing_summary(ice_entry, len(all_strain_experiment_links) - len(
-        unprocessed_strain_experiment_links), (
-                                           strain_performance.end_time -
-                                           strain_performance.start_time).total_seconds())
+        unprocessed_link_urls), (strain_performance.end_time -
+                                               strain_performance.start_time))
     strain_performance.print_summary()
 
 
 def process_edd_strain(edd_strain, processing_inputs, process_all_ice_entry_links,
-                       processing_summary, scan_percent_when_complete=None):
+                       processing_summary, scan_percent_when_complete=None,
+                       ice_entry_future=None):
     """
     Processes a single EDD strain, verifying that ICE already has links to its associated
     studies, or creating / maintaining them as needed to bring ICE up-to-date.
     :param scan_percent_when_complete:
+    :param ice_entry_future: an optional Future for a previously-started lookup of the ICE entry
+        referenced by this strain and its experiment links (see prefetch_ice_entries()). If
+        None, both are looked up here.
     :param edd_strain: the edd Strain to process
     :param process_all_ice_entry_links: True to process all experiment links associated with the
     linked ICE entry. This enables us to optimize a later scan of ICE by skipping this ICE entry
@@ -1730,12 +2116,12 @@ def process_edd_strain(edd_strain, processing_inputs, process_all_ice_entry_link
     print(separator)
 
     strain_performance = (
-        StrainProcessingPerformance(edd_strain, arrow.utcnow(), edd.session.wait_time,
+        StrainProcessingPerformance(edd_strain, time.monotonic(), edd.session.wait_time,
                                     ice.session.wait_time,
                                     scan_percent_when_complete=scan_percent_when_complete))
     if not edd_strain.registry_id:
         processing_summary.found_orphaned_edd_strain(edd_strain)
-        strain_performance.set_end_time(arrow.utcnow(), edd.session.wait_time,
+        strain_performance.set_end_time(time.monotonic(), edd.session.wait_time,
                                         ice.session.wait_time)
         strain_performance.print_summary()
         return False
@@ -1746,10 +2132,18 @@ def process_edd_strain(edd_strain, processing_inputs, process_all_ice_entry_link
     # Additionally, looking up the ICE part gives us a cleaner way of working
     #  around SYNBIO-XXX, which causes ICE to return 500 error instead of 404
     # when experiments can't be found for a non-existent part
-    ice_entry = ice.get_entry(edd_strain.registry_id)
+    if ice_entry_future:
+        ice_entry, ice_entry_links = ice_entry_future.result()
+
+        # if another EDD strain references the same entry, its links may have changed since
+        # they were prefetched
+        if processing_summary.is_edd_strain_processed(edd_strain.registry_id):
+            ice_entry_links = None
+    else:
+        ice_entry, ice_entry_links = ice.get_entry(edd_strain.registry_id), None
     if not ice_entry:
         processing_summary.found_stepchild_edd_strain(edd_strain)
-        strain_performance.set_end_time(arrow.utcnow(), edd.session.wait_time,
+        strain_performance.set_end_time(time.monotonic(), edd.session.wait_time,
                                         ice.session.wait_time)
         strain_performance.print_summary()
         return False
@@ -1759,7 +2153,8 @@ def process_edd_strain(edd_strain, processing_inputs, process_all_ice_entry_link
 
     # if there's an Ice entry associated with this EDD strain, compare links
     process_matching_strain(edd_strain, ice_entry, process_all_ice_entry_links,
-                            processing_inputs, processing_summary, strain_performance)
+                            processing_inputs, processing_summary, strain_performance,
+                            ice_entry_links=ice_entry_links)
 
     return True
 
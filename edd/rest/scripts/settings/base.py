@@ -34,7 +34,11 @@ VERIFY_ICE_CERT = True
 ICE_REQUEST_TIMEOUT = (10, 10)
 EDD_REQUEST_TIMEOUT = (10, 10)
 
-DEFAULT_LOCALE = b'C.UTF-8'  # works in Docker Debian container. Use b'en_US.UTF-8' for OSX.
+# HTTP connection pooling / retries. Pool size is the max number of kept-alive connections to
+# each EDD/ICE host, and should be at least the number of threads making concurrent requests.
+# Retries only apply to connection errors and to 502/503/504 responses.
+REQUEST_POOL_SIZE = 16
+REQUEST_MAX_RETRIES = 3
 
 ###################################################################################################
 # Application-specific configuration for create_lines.py.
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import weakref
+
 from .utils import remove_trailing_slash
 
 
@@ -18,11 +20,30 @@ class RestApiClient(object):
 
         self._application_name = application_name
         self.session = session
+        # release the session's pooled connections when this client is garbage collected or the
+        # interpreter exits, even if close() is never called
+        self._finalizer = weakref.finalize(self, session.close)
         # The requested upper limit for the number of results returned from a single API call.
         # Note that the server may not respect the upper limit, for instance if it has its own
         # hard upper limit.
         self.result_limit = result_limit
 
+    def close(self):
+        """
+        Releases any pooled connections held by this client's session. The same session is used
+        for all calls made by a client, so connections to the application are kept alive and
+        reused until the client is closed. Clients that aren't explicitly closed release their
+        connections when they're garbage collected, or at exit. Calling close() more than once
+        has no further effect.
+        """
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     @property
     def result_limit(self):
         return self.session.result_limit
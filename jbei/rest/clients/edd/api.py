@@ -353,7 +353,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=MeasurementUnit)
+        return DrfPagedResult.of(response.content, model_class=MeasurementUnit)
 
     def _enforce_valid_kwargs(self, kwargs):
         if kwargs:
@@ -399,7 +399,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=MeasurementType)
+        return DrfPagedResult.of(response.content, model_class=MeasurementType)
 
     def search_measurements(self, **kwargs):
         """
@@ -475,7 +475,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=Measurement)
+        return DrfPagedResult.of(response.content, model_class=Measurement)
 
     def search_values(self, **kwargs):
         """
@@ -525,7 +525,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=MeasurementValue)
+        return DrfPagedResult.of(response.content, model_class=MeasurementValue)
 
     def _detect_invalid_kwargs(self, **kwargs):
         if kwargs:
@@ -602,7 +602,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=MetadataType)
+        return DrfPagedResult.of(response.content, model_class=MetadataType)
 
     def get_protocol(self, id=None):
         """
@@ -636,7 +636,7 @@ class EddApi(RestApiClient):
         if response.status_code == requests.codes.not_found:
             return None
         response.raise_for_status()  # raise an Exception for unexpected reply
-        kwargs = json.loads(response.text)
+        kwargs = json.loads(response.content)
         return result_class(**kwargs)
 
     def search_protocols(self, **kwargs):
@@ -684,7 +684,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=Protocol)
+        return DrfPagedResult.of(response.content, model_class=Protocol)
 
     def search_studies(self, **kwargs):
         """
@@ -696,6 +696,9 @@ class EddApi(RestApiClient):
         :param slug: the slug (URL portion) that uniquely identifies the study within this
             DD instance.  This is the URL portion visible in the web browser when
             accessing a study.
+        :param ids: one or more integer primary keys for studies to return. Use this to look up
+            a batch of known studies in a single request rather than calling get_study() for each
+            one.
         :param name_regex: a regular expression for the name (case-insensitive).
         :param description_regex: a regular expression for the description (case-insensitive)
         :param created_after: a datetime used to filter objects by creation date (inclusive)
@@ -714,13 +717,14 @@ class EddApi(RestApiClient):
 
         query_url = kwargs.pop("query_url", None)
         if query_url:
-            response = self.session.get(url, headers=self._json_header)
+            response = self.session.get(query_url, headers=self._json_header)
         else:
             search_params = {}
             _set_if_value_valid(
                 search_params, PAGE_NUMBER_URL_PARAM, kwargs.pop("page_number", None)
             )
             _set_if_value_valid(search_params, "slug", kwargs.pop("slug", None))
+            _set_multivalue_pk_input(search_params, "pk__in", kwargs.pop("ids", None))
             unprocessed_kwargs = self._add_eddobject_search_params(
                 search_params, **kwargs
             )
@@ -735,7 +739,7 @@ class EddApi(RestApiClient):
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=Study)
+        return DrfPagedResult.of(response.content, model_class=Study)
 
     def search_lines(self, **kwargs):
         """
@@ -791,7 +795,7 @@ class EddApi(RestApiClient):
 
         response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=Line)
+        return DrfPagedResult.of(response.content, model_class=Line)
 
     def search_assays(self, **kwargs):
         """
@@ -856,7 +860,7 @@ class EddApi(RestApiClient):
 
         response.raise_for_status()
 
-        return DrfPagedResult.of(response.text, model_class=Assay)
+        return DrfPagedResult.of(response.content, model_class=Assay)
 
     def get_study(self, id):
         """
@@ -897,7 +901,9 @@ class DrfPagedResult(PagedResult):
         set of results.
 
         :param json_string: the raw content of the HTTP response containing potentially paged
-            content
+            content. Raw response bytes are preferred, since json.loads() detects their UTF
+            encoding directly, while decoding Response.text may require a much slower guess at
+            the character set.
         :param model_class: the class object to use in instantiating object instances to capture
             individual query results
         :param serializer_class: the serializer class to use in deserializing result data
@@ -12,15 +12,27 @@ the network.
 import importlib
 import json
 import logging
+import math
 import os
 import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import parse_qs
 
 import requests
 from requests.compat import urlencode, urlparse, urlunparse
-from six.moves.urllib.parse import ParseResult, parse_qs
 
 from jbei.rest.api import RestApiClient
-from jbei.rest.sessions import PagedResult, PagedSession, Session
+from jbei.rest.sessions import (
+    PagedResult,
+    PagedSession,
+    Session,
+    mount_retrying_adapter,
+)
 
 from . import constants
 from .utils import build_entry_ui_url
@@ -31,46 +43,108 @@ logger = logging.getLogger(__name__)
 ###################################################################################################
 # Set reasonable defaults where possible
 ###################################################################################################
-ICE_REQUEST_TIMEOUT = (10, 10)  # request and read timeout, respectively, in seconds
-ICE_URL = "https://registry.jbei.org"
-ICE_SECRET_KEY = None
+IceConfig = namedtuple("IceConfig", ["request_timeout", "url", "secret_key"])
+_DEFAULT_ICE_CONFIG = IceConfig(
+    request_timeout=(10, 10),  # request and read timeout, respectively, in seconds
+    url="https://registry.jbei.org",
+    secret_key=None,
+)
 
 ###################################################################################################
 # Perform flexible configuration based on whether or not client code or an environment
-# variable has defined an alternate source of the required settings. If not, define some defaults
-# here that will be used instead (though notably, no HMAC key will be available).
+# variable has defined an alternate source of the required settings. If not, the defaults above
+# will be used instead (though notably, no HMAC key will be available). Settings are only
+# resolved on first use, so importing this module doesn't also import the settings module or
+# Django.
 ###################################################################################################
 
-# if an ICE-specific settings module has been defined, override defaults with values provided
-# there.
-settings_module_name = os.environ.get("ICE_SETTINGS_MODULE")
-settings_django_name = os.environ.get("DJANGO_SETTINGS_MODULE")
-settings = None
-if settings_module_name:
-    settings = importlib.import_module(settings_module_name)
-# otherwise, if an a django settings module is defined, get configuration from there instead
-elif settings_django_name:
+
+def _load_settings():
+    # if an ICE-specific settings module has been defined, override defaults with values
+    # provided there.
+    settings_module_name = os.environ.get("ICE_SETTINGS_MODULE")
+    settings_django_name = os.environ.get("DJANGO_SETTINGS_MODULE")
+    if settings_module_name:
+        return importlib.import_module(settings_module_name)
+    # otherwise, if an a django settings module is defined, get configuration from there instead
+    if settings_django_name:
+        try:
+            # Django may not be present, don't try to import unless settings environment exists
+            from django.conf import settings
+        except ImportError as i:
+            logger.error(
+                "DJANGO_SETTINGS_MODULE environment variable was provided as a source "
+                "of settings, but an import error occurred while trying to load Django "
+                "settings."
+            )
+            raise i
+        return settings
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_ice_config():
+    """
+    Gets the ICE configuration, loading it from the settings module on the first call.
+    :return: an IceConfig
+    """
+    settings = _load_settings()
+    # try to grab values from settings object which may have been set above; default to
+    #   originals if not found
+    return IceConfig(
+        request_timeout=getattr(
+            settings, "ICE_REQUEST_TIMEOUT", _DEFAULT_ICE_CONFIG.request_timeout
+        ),
+        url=getattr(settings, "ICE_URL", _DEFAULT_ICE_CONFIG.url),
+        secret_key=getattr(settings, "ICE_SECRET_KEY", _DEFAULT_ICE_CONFIG.secret_key),
+    )
+
+
+# module-level names of the lazily-loaded settings, kept for compatibility with client code
+_ICE_CONFIG_ATTRIBUTES = {
+    "ICE_REQUEST_TIMEOUT": "request_timeout",
+    "ICE_URL": "url",
+    "ICE_SECRET_KEY": "secret_key",
+}
+
+
+def __getattr__(name):
     try:
-        # Django may not be present, don't try to import unless settings environment exists
-        from django.conf import settings
-    except ImportError as i:
-        logger.error(
-            "DJANGO_SETTINGS_MODULE environment variable was provided as a source of "
-            "settings, but an import error occurred while trying to load Django "
-            "settings."
-        )
-        raise i
-# try to grab values from settings object which may have been set above; default to originals
-#   if not found
-ICE_REQUEST_TIMEOUT = getattr(settings, "ICE_REQUEST_TIMEOUT", ICE_REQUEST_TIMEOUT)
-ICE_URL = getattr(settings, "ICE_URL", ICE_URL)
-ICE_SECRET_KEY = getattr(settings, "ICE_SECRET_KEY", ICE_SECRET_KEY)
+        return getattr(get_ice_config(), _ICE_CONFIG_ATTRIBUTES[name])
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
 VERIFY_SSL_DEFAULT = Session.VERIFY_SSL_DEFAULT
 
+# connection pool and retry settings for each IceApi's session. ICE calls tend to come in bursts
+# to the same host (e.g. paging through results, or removing several experiment links), so keep
+# more connections alive than requests' default of 10
+ICE_POOL_CONNECTIONS = 8
+ICE_POOL_MAXSIZE = 32
+ICE_MAX_RETRIES = 3
+ICE_RETRY_BACKOFF_FACTOR = 0.3
+
+# the maximum number of concurrent DELETE requests used to remove experiment links from an entry
+MAX_CONCURRENT_LINK_REMOVALS = 8
+# the maximum number of concurrent requests an IceApi uses to get the remaining pages of paged
+# results, shared by all the threads using it
+MAX_CONCURRENT_PAGE_REQUESTS = 8
+
+# suggested size and lifetime (in seconds) for an IceApi's cache of entries read via
+# get_entry(), for clients that opt into caching. Caching is off by default
+ENTRY_CACHE_SIZE = 1024
+ENTRY_CACHE_TTL = 60
+
 
 ###################################################################################################
 
-_JSON_CONTENT_TYPE_HEADER = {"Content-Type": "application/json; charset=utf8"}
+# default headers for every request made by an IceApi's session. Since the session sets the
+# Content-Type, requests won't replace it when serializing json= request bodies
+_JSON_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json; charset=utf8",
+}
 
 # regular expressions for parsing elements of ICE URLs
 _PROTOCOL = "http|https"
@@ -122,6 +196,26 @@ PART_KEYWORD_CHANGES = {
     "shortDescription": "short_description",
     "viewCount": "view_count",
 }
+# inverse of PART_KEYWORD_CHANGES, used to serialize parts back to ICE's JSON keywords
+_PART_JSON_KEYWORDS = {
+    python_keyword: json_keyword
+    for json_keyword, python_keyword in PART_KEYWORD_CHANGES.items()
+}
+
+# part JSON that Entry.of() converts to custom Python objects rather than builtin data types
+_LINKED_PARTS_JSON_KEYWORD = "linkedParts"
+_PARENTS_JSON_KEYWORD = "parents"
+_NONTRIVIAL_PART_JSON_KEYWORDS = frozenset(
+    [_LINKED_PARTS_JSON_KEYWORD, _PARENTS_JSON_KEYWORD]
+)
+
+# TODO: investigate JSON data in this set that we don't currently understand / support.
+_IGNORED_PART_JSON_KEYWORDS = frozenset(["parameters"])
+
+# part JSON that Entry.of() skips when copying builtin data types into keyword arguments
+_SKIPPED_PART_JSON_KEYWORDS = (
+    _NONTRIVIAL_PART_JSON_KEYWORDS | _IGNORED_PART_JSON_KEYWORDS
+)
 
 GENOTYPE_PHENOTYPE_JSON_PARAM = "genotypePhenotype"
 STRAIN_KEYWORD_CHANGES = {
@@ -142,6 +236,35 @@ ARABIDOPSIS_KEYWORD_CHANGES = {
 
 PROTEIN_KEYWORD_CHANGES = {"geneName": "gene_name"}
 
+SAMPLE_KEYWORD_CHANGES = {
+    "partId": "part_id",
+    "canEdit": "can_edit",
+    "creationTime": "creation_time",
+    "inCart": "in_cart",
+}
+
+USER_KEYWORD_CHANGES = {
+    "firstName": "first_name",
+    "lastName": "last_name",
+    "lastLogin": "last_login",
+    "registerDate": "registration_date",
+    "userEntryCount": "user_entry_count",
+    "visibleEntryCount": "visible_entry_count",
+    "isAdmin": "is_admin",
+    "newMessageCount": "new_message_count",
+    "accountType": "account_type",
+    "defaultPermissions": "default_permissions_list",
+}
+
+SEARCH_RESULT_ENTRY_PYTHON_PARAM = "entry"
+SEARCH_RESULT_KEYWORD_CHANGES = {
+    "eValue": "e_value",
+    "queryLength": "query_length",
+    "maxScore": "max_score",
+    "matchDetails": "match_details",
+    "entryInfo": SEARCH_RESULT_ENTRY_PYTHON_PARAM,
+}
+
 
 class IceApiException(Exception):
     def __init__(self, message="", code=requests.codes.internal_server_error):
@@ -155,10 +278,55 @@ class Entry(object):
     that's deprecated.
     """
 
+    # entries are built in bulk from search results and folder contents, so avoid allocating a
+    # __dict__ for each one. Subclasses declare __slots__ for only their additional members.
+    __slots__ = (
+        "id",
+        "visible",
+        "parents",
+        "index",
+        "uuid",
+        "name",
+        "owner",
+        "owner_email",
+        "owner_id",
+        "creator",
+        "creator_email",
+        "creator_id",
+        "status",
+        "short_description",
+        "long_description",
+        "creation_time",
+        "mod_time",
+        "biosafety_level",
+        "part_id",
+        "links",
+        "pi_name",
+        "pi_email",
+        "pi_id",
+        "selection_markers",
+        "bp_count",
+        "feature_count",
+        "view_count",
+        "has_attachment",
+        "has_sample",
+        "has_sequence",
+        "has_original_sequence",
+        "can_edit",
+        "access_permissions",
+        "public_read",
+        "linked_parts",
+        "alias",
+        "keywords",
+        "intellectual_property",
+        "references",
+        "funding_source",
+    )
+
     def __init__(self, **kwargs):
         self.id = kwargs.get("id", None)
         self.visible = kwargs.get("visible", None)
-        self.parents = kwargs.get("parents", [])
+        self.parents = kwargs.get("parents") or []
         self.index = kwargs.get("index", None)
         self.uuid = kwargs.get("uuid", None)
         self.name = kwargs.get("name", None)
@@ -175,7 +343,7 @@ class Entry(object):
         self.mod_time = kwargs.get("mod_time", None)
         self.biosafety_level = kwargs.get("biosafety_level", None)
         self.part_id = kwargs.get("part_id", None)
-        self.links = kwargs.get("links", [])
+        self.links = kwargs.get("links") or []
         self.pi_name = kwargs.get("pi_name", None)
         self.pi_email = kwargs.get("pi_email", None)
         self.pi_id = kwargs.get("pi_id", None)
@@ -188,11 +356,11 @@ class Entry(object):
         self.has_sequence = kwargs.get("has_sequence", None)
         self.has_original_sequence = kwargs.get("has_original_sequence", None)
         self.can_edit = kwargs.get("can_edit", None)
-        self.access_permissions = kwargs.get("access_permissions", [])
+        self.access_permissions = kwargs.get("access_permissions") or []
         self.public_read = kwargs.get("public_read", False)
-        self.linked_parts = kwargs.get("linked_parts", [])
+        self.linked_parts = kwargs.get("linked_parts") or []
         self.alias = kwargs.get("alias", None)
-        self.keywords = kwargs.get("keywords", [])
+        self.keywords = kwargs.get("keywords") or []
         self.intellectual_property = kwargs.get("intellectual_property", None)
         self.references = kwargs.get("references", None)
         self.funding_source = kwargs.get("funding_source", None)
@@ -213,33 +381,29 @@ class Entry(object):
         python_object_params = {}
 
         # linked parts
-        _LINKED_PARTS_JSON_KEYWORD = "linkedParts"
         linked_parts_temp = json_dict.get(_LINKED_PARTS_JSON_KEYWORD)
         linked_parts = (
-            (Entry.of(linked_part_dict) for linked_part_dict in linked_parts_temp)
+            [
+                Entry.of(linked_part_dict, silence_type_specific_warnings)
+                for linked_part_dict in linked_parts_temp
+            ]
             if linked_parts_temp
             else []
         )
         python_object_params["linked_parts"] = linked_parts
 
         # parents
-        _PARENTS_JSON_KEYWORD = "parents"
-        _PARENTS_PYTHON_KEYWORD = "parents"
         parents_list = json_dict.get(_PARENTS_JSON_KEYWORD)
         parents_list = (
-            (Entry.of(parent_dict) for parent_dict in parents_list)
+            [
+                Entry.of(parent_dict, silence_type_specific_warnings)
+                for parent_dict in parents_list
+            ]
             if parents_list
             else []
         )
-        python_object_params[_PARENTS_PYTHON_KEYWORD] = parents_list
+        python_object_params["parents"] = parents_list
 
-        # set/replace object parameters in the dictionary
-        _LINKED_PARTS_PYTHON_KEYWORD = "linked_parts"
-
-        nontrivial_conversion_keywords = {
-            _LINKED_PARTS_JSON_KEYWORD: _LINKED_PARTS_PYTHON_KEYWORD,
-            _PARENTS_JSON_KEYWORD: _PARENTS_PYTHON_KEYWORD,
-        }
         ###########################################################################################
         # set objects that have a trivial conversion from JSON to Python,
         # changing the style to match Python's snake_case from the ICE's Java-based camelCase
@@ -250,62 +414,24 @@ class Entry(object):
         # http://stackoverflow.com/questions/1175208/elegant-python-function-to
         #  -convert-camelcase-to-camel-case, but seems a bit problematic, license-wise.
 
-        # TODO: investigate JSON data in this dictionary that we don't currently understand /
-        # support.
-        _IGNORED_PART_KEYWORDS = ["parameters"]
-
-        for json_keyword, json_value in json_dict.items():
-            # skip data that translate to custom Python objects rather than builtin data types
-            if json_keyword in nontrivial_conversion_keywords:
-                continue
-
-            if json_keyword in _IGNORED_PART_KEYWORDS:
-                continue
-
-            python_keyword = PART_KEYWORD_CHANGES.get(json_keyword, json_keyword)
-            python_object_params[python_keyword] = json_value
+        python_object_params.update(
+            {
+                PART_KEYWORD_CHANGES.get(json_keyword, json_keyword): json_value
+                for json_keyword, json_value in json_dict.items()
+                if json_keyword not in _SKIPPED_PART_JSON_KEYWORDS
+            }
+        )
 
         part_type = python_object_params.pop(
             "type"
         )  # Note: don't shadow Python builtin 'type'!
 
-        if constants.ENTRY_TYPE_PLASMID == part_type:
-            return _construct_part(
-                python_object_params,
-                part_type,
-                constants.PLASMID_DATA_JSON_KEYWORD,
-                PLASMID_KEYWORD_CHANGES,
-                Plasmid,
-                silence_type_specific_warnings,
-            )
-
-        if constants.ENTRY_TYPE_STRAIN == part_type:
-            return _construct_part(
-                python_object_params,
-                part_type,
-                constants.STRAIN_DATA_JSON_KEYWORD,
-                STRAIN_KEYWORD_CHANGES,
-                Strain,
-                silence_type_specific_warnings,
-            )
-
-        if constants.ENTRY_TYPE_ARABIDOPSIS == part_type:
-            return _construct_part(
-                python_object_params,
-                part_type,
-                constants.ARABIDOPSIS_DATA_JSON_KEYWORD,
-                ARABIDOPSIS_KEYWORD_CHANGES,
-                Arabidopsis,
-                silence_type_specific_warnings,
-            )
-
-        if constants.ENTRY_TYPE_PROTEIN == part_type:
+        part_construction = _PART_CONSTRUCTION_PARAMS.get(part_type)
+        if part_construction:
             return _construct_part(
                 python_object_params,
                 part_type,
-                constants.PROTEIN_DATA_JSON_KEYWORD,
-                PROTEIN_KEYWORD_CHANGES,
-                Protein,
+                *part_construction,
                 silence_type_specific_warnings,
             )
 
@@ -322,24 +448,43 @@ class Entry(object):
         return f'{self.part_id} / "{self.name}" / ({self.uuid})'
 
     def to_json_dict(self):
-        # copy all data members into a dictionary
-        json_dict = self.__dict__.copy()
-
-        # reverse the json -> python keyword changes performed during deserialization
-        for json_keyword, python_keyword in PART_KEYWORD_CHANGES.items():
-            value = json_dict.pop(python_keyword)
-            if value:
+        # copy all data members into a dictionary, reversing the json -> python keyword changes
+        # performed during deserialization. Translated keywords are omitted if empty.
+        json_dict = {}
+        for python_keyword in _slot_names(type(self)):
+            value = getattr(self, python_keyword)
+            json_keyword = _PART_JSON_KEYWORDS.get(python_keyword)
+            if json_keyword is None:
+                json_dict[python_keyword] = value
+            elif value:
                 json_dict[json_keyword] = value
 
         return json_dict
 
 
+@lru_cache(maxsize=None)
+def _slot_names(cls):
+    """
+    Gets the names of all data members declared in __slots__ by cls and its base classes, in
+    the order they're declared, starting with the base class
+    """
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in klass.__dict__.get("__slots__", ())
+    )
+
+
 class ExperimentLink(object):
     """
     The Python implementation of an 'experiment link' stored by ICE to reference
     another arbitrary URL
     """
 
+    # entries can have many links, and clients commonly cache all of them, so avoid allocating a
+    # __dict__ for each one
+    __slots__ = ("label", "id", "url", "owner_email", "creation_time")
+
     def __init__(self, id, url, owner_email, creation_time, label=None):
         self.label = label
         self.id = id
@@ -393,6 +538,8 @@ class Location(object):
     The Python representation of a sample storage location
     """
 
+    __slots__ = ("id", "display", "location_type", "child", "name")
+
     def __init__(self, id, display, location_type, name, child=None):
         self.id = id
         self.display = display
@@ -438,6 +585,18 @@ class Sample(object):
     The Python representation of a biological sample
     """
 
+    __slots__ = (
+        "id",
+        "depositor",
+        "label",
+        "location",
+        "part_id",
+        "can_edit",
+        "comments",
+        "creation_time",
+        "in_cart",
+    )
+
     def __init__(
         self,
         id,
@@ -464,20 +623,11 @@ class Sample(object):
     def of(json_dict):
 
         # translate from camel-case JSON keywords to snake case Python data member names
-        json_to_python_keyword_changes = {
-            "partId": "part_id",
-            "canEdit": "can_edit",
-            "creationTime": "creation_time",
-            "inCart": "in_cart",
+        translated_dict = {
+            SAMPLE_KEYWORD_CHANGES.get(java_keyword, java_keyword): value
+            for java_keyword, value in json_dict.items()
         }
 
-        translated_dict = {}
-        for java_keyword, value in json_dict.items():
-            python_keyword = json_to_python_keyword_changes.get(
-                java_keyword, java_keyword
-            )
-            translated_dict[python_keyword] = value
-
         # unpack User object
         depositor_dict = translated_dict.pop("depositor")
         depositor = User.of(depositor_dict)
@@ -501,21 +651,17 @@ def _construct_part(
 
     class_data = python_object_params.pop(class_data_keyword, None)
     if class_data:
-        for keyword, value in class_data.items():
-            python_keyword = keyword
-            if keyword in conversion_dict:
-                python_keyword = conversion_dict[keyword]
-            python_object_params[python_keyword] = value
+        python_object_params.update(_convert_json_keywords(class_data, conversion_dict))
     elif not silence_type_specific_warnings:
         logger.warning(
             'JSON for %(class_name)s "%(part_id)s" has type=%(type)s, but no '
-            "%(field_name)s field."
-            % {
+            "%(field_name)s field.",
+            {
                 "class_name": part_derived_class.__name__,
                 "part_id": python_object_params["part_id"],
                 "type": part_type,
                 "field_name": class_data_keyword,
-            }
+            },
         )
     return part_derived_class(**python_object_params)
 
@@ -529,13 +675,9 @@ def _convert_json_keywords(json_dict, conversion_dict):
         keywords not present here are assumed to be identical in both.
     :return: a new dictionary with Python-formatted keys
     """
-    converted_dict = {}
-    for keyword, value in json_dict:
-        python_keyword = conversion_dict[keyword]
-        if not python_keyword:
-            python_keyword = keyword
-        converted_dict[python_keyword] = value
-    return converted_dict
+    return {
+        conversion_dict.get(keyword, keyword): value for keyword, value in json_dict.items()
+    }
 
 
 NORMAL_ACCOUNT_TYPE = "NORMAL"
@@ -544,6 +686,24 @@ USER_ACCOUNT_TYPES = (NORMAL_ACCOUNT_TYPE, ADMIN_ACCOUNT_TYPE)
 
 
 class User(object):
+    __slots__ = (
+        "id",
+        "email",
+        "initials",
+        "first_name",
+        "last_name",
+        "institution",
+        "description",
+        "last_login",
+        "registration_date",
+        "user_entry_count",
+        "visible_entry_count",
+        "is_admin",
+        "new_message_count",
+        "account_type",
+        "default_permissions_list",
+    )
+
     def __init__(
         self,
         id,
@@ -582,32 +742,26 @@ class User(object):
 
     @staticmethod
     def of(json_dict):
-        json_to_python_keyword_changes = {
-            "firstName": "first_name",
-            "lastName": "last_name",
-            "lastLogin": "last_login",
-            "registerDate": "registration_date",
-            "userEntryCount": "user_entry_count",
-            "visibleEntryCount": "visible_entry_count",
-            "isAdmin": "is_admin",
-            "newMessageCount": "new_message_count",
-            "accountType": "account_type",
-            "defaultPermissions": "default_permissions_list",
+        translated_dict = {
+            USER_KEYWORD_CHANGES.get(java_keyword, java_keyword): value
+            for java_keyword, value in json_dict.items()
         }
-
-        translated_dict = {}
-        for java_keyword, value in json_dict.items():
-            python_keyword = json_to_python_keyword_changes.get(
-                java_keyword, java_keyword
-            )
-            translated_dict[python_keyword] = value
-
         return User(**translated_dict)
 
 
 class EntrySearchResult(object):
     # TODO: resolve nident changes with Hector P -- not pushed to Github yet, though recently
     # observed on registry-test
+    __slots__ = (
+        "entry",
+        "e_value",
+        "query_length",
+        "nident",
+        "score",
+        "max_score",
+        "match_details",
+    )
+
     def __init__(
         self, entry, e_value, query_length, score, max_score, match_details, nident=None
     ):
@@ -621,32 +775,27 @@ class EntrySearchResult(object):
 
     @staticmethod
     def of(json_dict):
-        # build a dict of keywords for translating field names from Java-based conventions used in
-        # ICE's JSON to Python style names
-        python_entry_keyword = "entry"
-        keyword_dict = {
-            "eValue": "e_value",
-            "queryLength": "query_length",
-            "maxScore": "max_score",
-            "matchDetails": "match_details",
-            "entryInfo": "entry",
+        # translate field names from Java-based conventions used in ICE's JSON to Python style
+        # names
+        translated_dict = {
+            SEARCH_RESULT_KEYWORD_CHANGES.get(java_keyword, java_keyword): value
+            for java_keyword, value in json_dict.items()
         }
 
-        translated_dict = {}
-        for java_keyword, value in json_dict.items():
-            python_keyword = keyword_dict.get(java_keyword, java_keyword)
-
-            # read the part into a Part object
-            if python_keyword == python_entry_keyword:
-                # NOTE: ICE doesn't return type-specific data as part of its search results
-                value = Entry.of(value, silence_type_specific_warnings=True)
-
-            translated_dict[python_keyword] = value
+        # read the part into a Part object
+        if SEARCH_RESULT_ENTRY_PYTHON_PARAM in translated_dict:
+            # NOTE: ICE doesn't return type-specific data as part of its search results
+            translated_dict[SEARCH_RESULT_ENTRY_PYTHON_PARAM] = Entry.of(
+                translated_dict[SEARCH_RESULT_ENTRY_PYTHON_PARAM],
+                silence_type_specific_warnings=True,
+            )
 
         return EntrySearchResult(**translated_dict)
 
 
 class Strain(Entry):
+    __slots__ = ("host", "genotype_phenotype")
+
     def __init__(self, host=None, genotype_phenotype=None, **kwargs):
         super(Strain, self).__init__(**kwargs)
         self.host = host
@@ -689,20 +838,18 @@ class Folder(object):
         self.type = kwargs.pop("type")
         self.can_edit = kwargs.pop("can_edit")
         self.creation_time = kwargs.pop("creation_time")
-        self.entries = []
-        for entry_dict in kwargs.pop("entries"):
-            self.entries.append(
-                Entry.of(entry_dict, silence_type_specific_warnings=True)
-            )
+        self.entries = [
+            Entry.of(entry_dict, silence_type_specific_warnings=True)
+            for entry_dict in kwargs.pop("entries")
+        ]
 
     @staticmethod
     def of(json_dict):
 
-        python_object_params = {}
-        for json_key, value in json_dict.items():
-            python_keyword = Folder.keyword_changes_dict.get(json_key, json_key)
-            python_object_params[python_keyword] = value
-
+        python_object_params = {
+            Folder.keyword_changes_dict.get(json_key, json_key): value
+            for json_key, value in json_dict.items()
+        }
         return Folder(**python_object_params)
 
     def to_json_dict(self):
@@ -726,6 +873,14 @@ class Folder(object):
 # data. TODO: confirm with Hector P. that this is intentional, then make them non-optional if
 # needed
 class Plasmid(Entry):
+    __slots__ = (
+        "backbone",
+        "origin_of_replication",
+        "promoters",
+        "circular",
+        "replicates_in",
+    )
+
     def __init__(
         self,
         backbone=None,
@@ -745,6 +900,8 @@ class Plasmid(Entry):
 
 
 class Protein(Entry):
+    __slots__ = ("organism", "gene_name")
+
     def __init__(self, organism=None, gene_name=None, **kwargs):
         super(Protein, self).__init__(**kwargs)
         self.organism = organism
@@ -753,6 +910,15 @@ class Protein(Entry):
 
 # TODO: class is a draft / isn't tested
 class Arabidopsis(Entry):
+    __slots__ = (
+        "ecotype",
+        "harvest_date",
+        "seed_parents",
+        "generation",
+        "plant_type",
+        "sent_to_a_brc",
+    )
+
     def __init__(
         self,
         ecotype=None,
@@ -782,6 +948,9 @@ def parse_entry_id(ice_entry_url):
     :return: the identifier for the part within its host
     ICE deployment, or None if the input didn't match the expected pattern.
     """
+    # cheap substring test first, since most URLs checked aren't ICE entry URLs at all
+    if not ice_entry_url or "/entry/" not in ice_entry_url.lower():
+        return None
     match = ICE_ENTRY_URL_PATTERN.match(ice_entry_url)
     if not match:
         return None
@@ -790,6 +959,64 @@ def parse_entry_id(ice_entry_url):
 
 DEFAULT_HMAC_KEY_ID = "edd"
 
+# for validating requested entry types in searches without building a set per search
+_ICE_ENTRY_TYPES = frozenset(constants.ICE_ENTRY_TYPES)
+
+
+class _TtlCache(object):
+    """
+    A minimal thread-safe cache whose items expire a fixed time after they're stored. Once the
+    cache is full, the least recently stored items are evicted first.
+    """
+
+    __slots__ = ("_maxsize", "_ttl", "_items", "_lock")
+
+    def __init__(self, maxsize, ttl):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expiration, value = item
+            if expiration <= time.monotonic():
+                del self._items[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (time.monotonic() + self._ttl, value)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+def _entry_aliases(entry_id, entry):
+    """
+    Gets all the identifiers an entry read from ICE can be requested by
+    :param entry_id: the identifier the entry was requested with
+    :return: a tuple of the identifiers, as strings
+    """
+    aliases = {str(entry_id)}
+    aliases.update(
+        str(alias) for alias in (entry.id, entry.uuid, entry.part_id) if alias is not None
+    )
+    return tuple(aliases)
+
+
 ENTRY_CLASS_TO_JSON_TYPE = {
     Arabidopsis.__name__: constants.ENTRY_TYPE_ARABIDOPSIS,
     Plasmid.__name__: constants.ENTRY_TYPE_PLASMID,
@@ -798,6 +1025,31 @@ ENTRY_CLASS_TO_JSON_TYPE = {
     Entry.__name__: constants.ENTRY_TYPE_ENTRY,
 }
 
+# maps ICE part type -> (type-specific JSON data keyword, keyword changes, Entry subclass),
+# used by Entry.of() to construct the right subclass with a single lookup
+_PART_CONSTRUCTION_PARAMS = {
+    constants.ENTRY_TYPE_PLASMID: (
+        constants.PLASMID_DATA_JSON_KEYWORD,
+        PLASMID_KEYWORD_CHANGES,
+        Plasmid,
+    ),
+    constants.ENTRY_TYPE_STRAIN: (
+        constants.STRAIN_DATA_JSON_KEYWORD,
+        STRAIN_KEYWORD_CHANGES,
+        Strain,
+    ),
+    constants.ENTRY_TYPE_ARABIDOPSIS: (
+        constants.ARABIDOPSIS_DATA_JSON_KEYWORD,
+        ARABIDOPSIS_KEYWORD_CHANGES,
+        Arabidopsis,
+    ),
+    constants.ENTRY_TYPE_PROTEIN: (
+        constants.PROTEIN_DATA_JSON_KEYWORD,
+        PROTEIN_KEYWORD_CHANGES,
+        Protein,
+    ),
+}
+
 
 class IceApi(RestApiClient):
     """
@@ -818,60 +1070,114 @@ class IceApi(RestApiClient):
     def __init__(
         self,
         auth,
-        base_url=ICE_URL,
+        base_url=None,
         result_limit=constants.DEFAULT_RESULT_LIMIT,
         verify_ssl_cert=VERIFY_SSL_DEFAULT,
+        entry_cache_size=0,
+        entry_cache_ttl=0,
+        pool_connections=ICE_POOL_CONNECTIONS,
+        pool_maxsize=ICE_POOL_MAXSIZE,
+        max_retries=ICE_MAX_RETRIES,
+        retry_backoff_factor=ICE_RETRY_BACKOFF_FACTOR,
     ):
         """
         Creates a new instance of IceApi
         :param auth: the authentication strategy for communication with ICE
         :param session: object implementing the Requests API; defaults to PagedSession
-        :param base_url: the base URL of the ICE install.
+        :param base_url: the base URL of the ICE install. Defaults to the configured ICE_URL.
         :param result_limit: the maximum number of results that can be returned from a single
             query. The default is ICE's default limit at the time of writing. Note that ICE
             doesn't return paging-related data from its REST API, so to provide consistent
             tracking of how results are paged, some value has to be provided.
+        :param entry_cache_size: the maximum number of entries read by get_entry() to cache
+            locally, or zero (the default) to disable caching. The same limit applies separately
+            to the entries whose experiment links are cached. See ENTRY_CACHE_SIZE.
+        :param entry_cache_ttl: the time in seconds that entries read by get_entry(), and the
+            experiment links read for entries, are cached for, or zero (the default) to disable
+            caching. See ENTRY_CACHE_TTL.
+        :param pool_connections: the number of connection pools to cache in the session's adapter
+        :param pool_maxsize: the maximum number of connections to keep alive in each pool. This
+            should be at least the number of threads making concurrent requests.
+        :param max_retries: the maximum number of retries for connection errors and 502/503/504
+            responses to idempotent requests
+        :param retry_backoff_factor: the backoff factor for the delay between retries
+        All calls made by this instance share a single session, whose connections to ICE are
+        kept alive and reused until close() is called.
         """
         if not auth:
             raise ValueError("A valid authentication mechanism must be provided")
+        if base_url is None:
+            base_url = get_ice_config().url
         session = PagedSession(
             constants.RESULT_LIMIT_PARAMETER,
             result_limit,
             auth=auth,
             verify_ssl_cert=verify_ssl_cert,
         )
+        # retry transient gateway errors. Only idempotent requests are retried, so e.g. link
+        # creation via POST is never repeated
+        mount_retrying_adapter(
+            session, pool_connections, pool_maxsize, max_retries, retry_backoff_factor
+        )
+        session.headers.update(_JSON_HEADERS)
         super(IceApi, self).__init__("ICE", base_url, session, result_limit)
+        # base_url is immutable, so build the prefixes of commonly-used resource URLs just once
+        self._parts_url = "%s/rest/parts/" % self.base_url
+        self._search_url = "%s/rest/search" % self.base_url
+        self._users_url = "%s/rest/users" % self.base_url
+        # entries are commonly looked up repeatedly while linking / unlinking, so serve
+        # repeated reads locally for a short time. Values are cached under each identifier of
+        # the entry (ID, UUID, part number) along with all of them, so the entry can be
+        # invalidated using any of them
+        self._entry_cache = None
+        self._entry_links_cache = None
+        if entry_cache_size and entry_cache_ttl:
+            self._entry_cache = _TtlCache(entry_cache_size, entry_cache_ttl)
+            self._entry_links_cache = _TtlCache(entry_cache_size, entry_cache_ttl)
+        # one executor gets the remaining pages for every _get_all_results() call, so threads
+        # that call it concurrently can't multiply the number of page requests in flight
+        self._page_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_PAGE_REQUESTS
+        )
+        self._page_executor_finalizer = weakref.finalize(
+            self, self._page_executor.shutdown, wait=False
+        )
 
-    def _compute_result_offset(self, page_number):
+    def close(self):
+        """
+        Stops the threads used to get pages of results, then releases the session's pooled
+        connections. See RestApiClient.close().
+        """
+        self._page_executor_finalizer()
+        super(IceApi, self).close()
+
+    def _page_offset(self, page_number):
+        """
+        Computes the result offset for a 1-indexed page of results
+        :return: the offset, or None for the first page, or if no result_limit is known
+        """
+        if not page_number or page_number == 1:
+            return None
         result_limit = self.result_limit
-        if page_number:
-            if not result_limit:
-                raise ValueError(
-                    "Non-unity page number specified, but result offset can't be "
-                    "computed because the result_limit isn't known"
-                )
-            else:
-                return result_limit * (page_number - 1)
-        return None
+        if not result_limit:
+            logger.warning(
+                "A non-unity page number was requested, but can't be honored "
+                "because no result_limit is known!"
+            )
+            return None
+        return result_limit * (page_number - 1)
 
     def _add_page_number_param(self, lookup, page_number):
-        if page_number:
-            if not self.result_limit:
-                if page_number != 1:
-                    logger.warning(
-                        "A non-unity page number was requested, but can't be honored "
-                        "because no result_limit is known!"
-                    )
-            else:
-                offset = self.session.result_limit * (page_number - 1)
-                lookup[constants.RESULT_OFFSET_PARAMETER] = offset
+        offset = self._page_offset(page_number)
+        if offset is not None:
+            lookup[constants.RESULT_OFFSET_PARAMETER] = offset
 
     def _extract_pagination_params(self, query_url):
-        query_params_string = urlparse(query_url).query
-        query_dict = parse_qs(query_params_string) if query_params_string else None
-        offset = query_dict.get[constants.RESULT_OFFSET_PARAMETER]
-        if offset:
-            offset = offset[0]
+        """
+        Gets the result offset from a query URL, or zero if the URL doesn't specify one
+        """
+        _, query_dict = parse_query_url(query_url)
+        return extract_int_parameter(query_dict, constants.RESULT_OFFSET_PARAMETER)
 
     def search_users(
         self,
@@ -900,7 +1206,7 @@ class IceApi(RestApiClient):
         if query_url:
             response = self.session.get(query_url)
         else:
-            url = "%s/rest/users" % self.base_url
+            url = self._users_url
             query_params = {}
             if search_string:
                 query_params["filter"] = search_string
@@ -912,7 +1218,7 @@ class IceApi(RestApiClient):
             response = self.session.get(url, params=query_params)
         if response.status_code == requests.codes.ok:
             return IcePagedResult.of(
-                response.text, User, results_key="users", query_url=response.url
+                response.content, User, results_key="users", query_url=response.url
             )
         response.raise_for_status()
 
@@ -931,18 +1237,16 @@ class IceApi(RestApiClient):
 
         response = None
         if query_url:
-            response = self.session.get(query_url, headers=_JSON_CONTENT_TYPE_HEADER)
+            response = self.session.get(query_url)
         else:
             query_params = {}
             self._add_page_number_param(query_params, page_number)
             # execute the query
-            url = "%s/rest/parts/%s/experiments/" % (self.base_url, entry_id)
-            response = self.session.get(
-                url, params=query_params, headers=_JSON_CONTENT_TYPE_HEADER
-            )
+            url = self._build_entry_experiments_url(entry_id)
+            response = self.session.get(url, params=query_params)
             query_url = response.url
         if response.status_code == requests.codes.ok:
-            return IcePagedResult.of(response.text, ExperimentLink, query_url=query_url)
+            return IcePagedResult.of(response.content, ExperimentLink, query_url=query_url)
         else:
             # NOTE: we purposefully DON'T return None for 404, since that would remove the clients'
             # ability to distinguish between a non-existent entry and an entry with no experiments
@@ -963,23 +1267,83 @@ class IceApi(RestApiClient):
 
         response = None
         if query_url:
-            response = self.session.get(query_url, headers=_JSON_CONTENT_TYPE_HEADER)
+            response = self.session.get(query_url)
         else:
             query_params = {}
             self._add_page_number_param(query_params, page_number)
             # execute the query
-            url = "%s/rest/parts/%s/samples/" % (self.base_url, entry_id)
-            response = self.session.get(
-                url, params=query_params, headers=_JSON_CONTENT_TYPE_HEADER
-            )
+            url = "%s%s/samples/" % (self._parts_url, entry_id)
+            response = self.session.get(url, params=query_params)
             query_url = response.url
         if response.status_code == requests.codes.ok:
-            return IcePagedResult.of(response.text, Sample, query_url=query_url)
+            return IcePagedResult.of(response.content, Sample, query_url=query_url)
         else:
             # NOTE: we purposefully DON'T return None for 404, since that would remove the clients'
             # ability to distinguish between a non-existent entry and and entry with no samples
             response.raise_for_status()
 
+    def _get_all_results(self, get_page):
+        """
+        Gets the results from every page of a paged ICE resource. ICE reports the total result
+        count along with the first page, so the remaining pages are all requested concurrently
+        over the session's pooled connections, rather than waiting on each page in turn to find
+        the next one. Requests for all callers share a single bounded executor, so this is safe
+        to call from many threads at once.
+        :param get_page: a function that accepts a 1-indexed page number and returns that page
+            of results as a PagedResult (or None)
+        :return: a list of the results from all pages
+        """
+        first_page = get_page(1)
+        if not first_page:
+            return []
+        results_pages = [first_page]
+
+        result_limit = self.result_limit
+        if first_page.next_page and result_limit:
+            page_count = math.ceil(first_page.total_result_count / result_limit)
+            results_pages.extend(
+                self._page_executor.map(get_page, range(2, page_count + 1))
+            )
+
+        return [
+            result
+            for results_page in results_pages
+            if results_page
+            for result in results_page.results
+        ]
+
+    def search_all_users(self, search_string=None, sort=None, asc=None):
+        """
+        Searches for users known to this instance of ICE, returning results from all pages.
+        See search_users().
+        :return: a list of Users
+        """
+        return self._get_all_results(
+            lambda page_number: self.search_users(
+                search_string=search_string, sort=sort, asc=asc, page_number=page_number
+            )
+        )
+
+    def get_all_entry_experiments(self, entry_id):
+        """
+        Retrieves all of ICE's experiment links for the specified entry, from all pages of
+        results. See get_entry_experiments().
+        :return: a list of ExperimentLinks
+        """
+        return self._get_all_results(
+            lambda page_number: self.get_entry_experiments(entry_id, page_number=page_number)
+        )
+
+    def get_all_entry_samples(self, entry_id):
+        """
+        Retrieves all of ICE's samples for the specified entry, from all pages of results. See
+        get_entry_samples().
+        :return: a list of Samples
+        """
+        return self._get_all_results(
+            lambda page_number: self.get_entry_samples(entry_id, page_number=page_number)
+        )
+
     def get_entry(self, entry_id, suppress_errors=False):
         """
         Retrieves an ICE entry using any of the unique identifiers: UUID (preferred), part
@@ -994,19 +1358,32 @@ class IceApi(RestApiClient):
         :param suppress_errors: true to catch and log exception messages and return None instead of
             raising Exceptions.
         :return: A Part object representing the response from ICE, or None if an an Exception
-            occurred but suppress_errors was true.
+            occurred but suppress_errors was true. If caching is enabled, entries found are
+            cached for a short time under each of their identifiers, so the same object may be
+            returned for repeated calls, and callers must not modify it. See invalidate_entry().
         """
-        rest_url = "%s/rest/parts/%s" % (self.base_url, entry_id)
+        entry_cache = self._entry_cache
+        if entry_cache:
+            cached = entry_cache.get(str(entry_id))
+            if cached is not None:
+                return cached[1]
+
+        rest_url = "%s%s" % (self._parts_url, entry_id)
         try:
             response = self.session.get(url=rest_url)
             response.raise_for_status()
-            json_dict = json.loads(response.text)
+            json_dict = json.loads(response.content)
             if json_dict:
-                return Entry.of(json_dict, False)
+                entry = Entry.of(json_dict, False)
+                if entry_cache:
+                    aliases = _entry_aliases(entry_id, entry)
+                    for alias in aliases:
+                        entry_cache.set(alias, (aliases, entry))
+                return entry
         except requests.exceptions.Timeout as e:
             if not suppress_errors:
                 raise e
-            logger.exception("Timeout requesting part %s: %s", entry_id)
+            logger.exception("Timeout requesting part %s", entry_id)
         except requests.exceptions.HTTPError as e:
             if response.status_code == requests.codes.not_found:
                 return None
@@ -1014,15 +1391,38 @@ class IceApi(RestApiClient):
                 raise e
             logger.exception(
                 "Error fetching part from ICE with entry_id %(entry_id)s. "
-                'Response = %(status_code)d: "%(msg)s"'
-                % {
+                'Response = %(status_code)d: "%(msg)s"',
+                {
                     "entry_id": entry_id,
                     "status_code": response.status_code,
                     "msg": response.reason,
-                }
+                },
             )
         return None
 
+    def invalidate_entry(self, entry_id=None):
+        """
+        Removes an entry and its experiment links from the caches used by get_entry() and the
+        link methods, so the next request for either reads it from ICE again. Once an entry has
+        been read by get_entry(), any of its identifiers (ID, UUID or part number) invalidates
+        it everywhere it's cached.
+        :param entry_id: any identifier of the entry, or None to clear the caches
+        """
+        caches = [cache for cache in (self._entry_cache, self._entry_links_cache) if cache]
+        if entry_id is None:
+            for cache in caches:
+                cache.clear()
+            return
+        key = str(entry_id)
+        aliases = {key}
+        for cache in caches:
+            cached = cache.get(key)
+            if cached is not None:
+                aliases.update(cached[0])
+        for alias in aliases:
+            for cache in caches:
+                cache.pop(alias)
+
     def get_folder(self, folder_id, partner_id=None):
         """
         Retrieves an ICE folder using its unique identifier
@@ -1046,7 +1446,7 @@ class IceApi(RestApiClient):
         if response.status_code == requests.codes.not_found:
             return None
         response.raise_for_status()
-        json_dict = json.loads(response.text)
+        json_dict = json.loads(response.content)
         return Folder.of(json_dict)
 
     def get_folder_entries(self, folder_id, page_num, partner_id=None, sort=None):
@@ -1082,7 +1482,7 @@ class IceApi(RestApiClient):
             return None
         response.raise_for_status()
 
-        json_dict = json.loads(response.text)
+        json_dict = json.loads(response.content)
         return Folder.of(json_dict)
 
     def folder_from_url(self, url):
@@ -1174,18 +1574,12 @@ class IceApi(RestApiClient):
 
         # override processing normally handled by session to apply non-standard
         # page numbering / result limiting needed by this ICE resource
-        if page_number:
-            if not self.result_limit:
-                if page_number != 1:
-                    logger.warning(
-                        "A non-unity page number was requested, but can't be honored "
-                        "because no result_limit is known!"
-                    )
-            else:
-                offset = self.session.result_limit * (page_number - 1)
-                parameters[nonstandard_offset_param] = offset
-        if self.result_limit:
-            parameters[nonstandard_result_limit_param] = self.result_limit
+        offset = self._page_offset(page_number)
+        if offset is not None:
+            parameters[nonstandard_offset_param] = offset
+        result_limit = self.result_limit
+        if result_limit:
+            parameters[nonstandard_result_limit_param] = result_limit
         if parameters:
             query_dict["parameters"] = parameters
 
@@ -1209,8 +1603,16 @@ class IceApi(RestApiClient):
             if search_terms:
                 query_dict["queryString"] = search_terms
             if entry_types:
-                if not set(entry_types).issubset(set(constants.ICE_ENTRY_TYPES)):
-                    raise KeyError("")
+                if not _ICE_ENTRY_TYPES.issuperset(entry_types):
+                    unsupported_types = [
+                        entry_type
+                        for entry_type in entry_types
+                        if entry_type not in _ICE_ENTRY_TYPES
+                    ]
+                    raise KeyError(
+                        "Entry types %s are not among the recognized types: %s"
+                        % (unsupported_types, str(constants.ICE_ENTRY_TYPES))
+                    )
                 query_dict["entryTypes"] = entry_types
             self._process_query_blast(query_dict, blast_program, blast_sequence)
             query_dict["webSearch"] = search_web  # Note: affects results even if false?
@@ -1227,14 +1629,11 @@ class IceApi(RestApiClient):
         Simple ICE search. Give a search term, get a list of entry dicts. Advanced searches should
         make use of the search_entries method to get Python objects.
         """
-        logger.info('Searching for ICE entries using search terms "%s"' % search_terms)
-        url = "%s/rest/search" % self.base_url
-        query_json = json.dumps({"queryString": search_terms})
-        response = self.session.post(
-            url, data=query_json, headers=_JSON_CONTENT_TYPE_HEADER
-        )
+        logger.info('Searching for ICE entries using search terms "%s"', search_terms)
+        url = self._search_url
+        response = self.session.post(url, json={"queryString": search_terms})
         response.raise_for_status()
-        results = json.loads(response.text)
+        results = json.loads(response.content)
         return [record["entryInfo"] for record in results["results"]]
 
     # TODO: doesn't support field filters yet, though ICE's API does
@@ -1280,8 +1679,8 @@ class IceApi(RestApiClient):
         """
         self._verify_page_number(page_number)
 
-        logger.info('Searching for ICE entries using search terms "%s"' % search_terms)
-        url = "%s/rest/search" % self.base_url
+        logger.info('Searching for ICE entries using search terms "%s"', search_terms)
+        url = self._search_url
         offset = None
         # package up provided parameters (if any) for insertion into the request
         # optional_query_data = json.dumps({'queryString': query}) if query else None
@@ -1296,16 +1695,14 @@ class IceApi(RestApiClient):
             page_number,
         )
 
-        # convert query data to JSON, if there is any. Otherwise, we'll query for all the parts
+        # send query data as JSON, if there is any. Otherwise, we'll query for all the parts
         # visible to this user
-        optional_query_data = json.dumps(query_dict) if query_dict else None
-        logger.info("Searching ICE entries. Query data = %s" % optional_query_data)
+        optional_query_data = query_dict if query_dict else None
+        logger.info("Searching ICE entries. Query data = %s", optional_query_data)
 
         # execute the query
         try:
-            response = self.session.post(
-                url, data=optional_query_data, headers=_JSON_CONTENT_TYPE_HEADER
-            )
+            response = self.session.post(url, json=optional_query_data)
             # if response was good, deconstruct the query url, then build a separate 'get' URL
             # to use in next/prev page links. Note that for now, we're leaving this code /
             # incorrect URL in place as a placeholder for future code. Presence / absence of
@@ -1315,16 +1712,12 @@ class IceApi(RestApiClient):
             if response.status_code == requests.codes.ok:
                 # TODO: consider reinstating / fixing this flawed method of computing a query_url
                 # for use by client programs. See other TODO above.
+                # url never has a query or fragment, so there's no need to parse it first.
                 # if not query_url:
-                #     url_elts = urlparse(url)
-                #     query_string = urlencode(query_dict, True)
-                #     query_temp = ParseResult(url_elts.scheme, url_elts.netloc,
-                #                                    url_elts.path, url_elts.params,
-                #                                    query_string, url_elts.fragment)
-                #     query_url = urlunparse(query_temp)
+                #     query_url = "%s?%s" % (url, urlencode(query_dict, True))
                 query_url = response.url
                 return IcePagedResult.of(
-                    response.text,
+                    response.content,
                     EntrySearchResult,
                     query_url=query_url,
                     result_limit=self.result_limit,
@@ -1333,12 +1726,12 @@ class IceApi(RestApiClient):
             elif suppress_errors:
                 logger.exception(
                     'Error searching ICE entries using query "%(query_str)s". '
-                    'Response was %(status_code)s: "%(msg)s"'
-                    % {
+                    'Response was %(status_code)s: "%(msg)s"',
+                    {
                         "query_str": search_terms,
                         "status_code": response.status_code,
                         "msg": response.reason,
-                    }
+                    },
                 )
                 return None
             else:
@@ -1346,7 +1739,7 @@ class IceApi(RestApiClient):
         except requests.exceptions.Timeout as e:
             if not suppress_errors:
                 raise e
-            logger.exception('Timeout searching ICE for query "%s"' % search_terms)
+            logger.exception('Timeout searching ICE for query "%s"', search_terms)
 
     def _create_or_update_link(
         self, study_name, study_url, entry_experiments_url, link_id=None, created=None
@@ -1368,20 +1761,18 @@ class IceApi(RestApiClient):
         # comments). Currently, there's no need to provide the link ID at all when adding/updating.
 
         logger.info(
-            "Requesting part-> study link from ICE (id=%s): %s"
-            % (link_id, entry_experiments_url)
+            "Requesting part-> study link from ICE (id=%s): %s",
+            link_id,
+            entry_experiments_url,
         )
 
-        headers = {"Content-Type": "application/json"}
         json_dict = {"label": study_name, "url": study_url}
         # if we're updating an existing link, use its full url
         if link_id:
             json_dict["id"] = link_id
 
-        json_str = json.dumps(json_dict)
-
-        session = self.session
-        response = session.post(entry_experiments_url, data=json_str, headers=headers)
+        # let requests serialize the JSON body and set its Content-Type
+        response = self.session.post(entry_experiments_url, json=json_dict)
 
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
@@ -1408,36 +1799,90 @@ class IceApi(RestApiClient):
         self._prevent_write_while_disabled()
 
         # Look up the links associated with this ICE part
-        entry_experiments_rest_url = self._build_entry_experiments_url(ice_entry_id)
-        response = self.session.get(
-            entry_experiments_rest_url, headers=_JSON_CONTENT_TYPE_HEADER
-        )
-        if response.status_code != requests.codes.ok:
-            response.raise_for_status()
+        json_dict = self._get_entry_link_dicts(ice_entry_id)
 
-        # Filter out links that aren't for this study
-        json_dict = (
-            response.json()
-        )  # TODO: doesn't account for results paging see EDD-200
+        # Filter out links that aren't for this study. URLs are compared case-insensitively
+        folded_study_url = study_url.casefold()
         study_links = [
-            link for link in json_dict if study_url.lower() == link.get("url").lower()
+            link
+            for link in json_dict
+            if folded_study_url == (link.get("url") or "").casefold()
         ]
-        logger.debug("Existing links response: " + json_dict.__str__())
+        logger.debug("Existing links response: %s", json_dict)
         if not study_links:
             logger.warning(
-                "No existing links found for (entry %s, study %d). Nothing to remove!"
-                % (ice_entry_id, study_id)
+                "No existing links found for (entry %s, study %d). Nothing to remove!",
+                ice_entry_id,
+                study_id,
             )
             return False
-        # Delete all links that reference this study URL
-        for link in study_links:
-            link_id = link.get("id")
-            logger.info("Deleting link %d from entry %s" % (link_id, ice_entry_id))
-            self.remove_experiment_link(ice_entry_id, link_id)
+        # Delete all links that reference this study URL. There's usually only one
+        link_ids = [link.get("id") for link in study_links]
+        for link_id in link_ids:
+            logger.info("Deleting link %d from entry %s", link_id, ice_entry_id)
+        self.remove_experiment_links(ice_entry_id, link_ids)
         return True
 
+    def _get_entry_link_dicts(self, ice_entry_id):
+        """
+        Gets the JSON dictionaries for all the experiment links from an ICE entry. If caching
+        is enabled and the entry is still in get_entry()'s cache, links are cached for a
+        short time under each of the entry's identifiers, and any changes made through this
+        instance invalidate them. Links for other entries aren't cached, since a change made
+        using a different identifier couldn't invalidate them. Callers must not modify the
+        returned list.
+        :raises HTTPError if a communication error occurred or if the server responded with a
+            status code other than 200
+        """
+        key = str(ice_entry_id)
+        links_cache = self._entry_links_cache
+        aliases = None
+        if links_cache:
+            cached = links_cache.get(key)
+            if cached is not None:
+                return cached[1]
+            cached = self._entry_cache.get(key)
+            aliases = cached[0] if cached is not None else None
+
+        entry_experiments_rest_url = self._build_entry_experiments_url(ice_entry_id)
+        response = self.session.get(entry_experiments_rest_url)
+        if response.status_code != requests.codes.ok:
+            response.raise_for_status()
+        # TODO: doesn't account for results paging see EDD-200
+        link_dicts = json.loads(response.content)
+        if aliases:
+            for alias in aliases:
+                links_cache.set(alias, (aliases, link_dicts))
+        return link_dicts
+
     def _build_entry_experiments_url(self, ice_entry_id):
-        return "%s/rest/parts/%s/experiments/" % (self.base_url, ice_entry_id)
+        return "%s%s/experiments/" % (self._parts_url, ice_entry_id)
+
+    def remove_experiment_links(self, ice_entry_id, link_ids):
+        """
+        Removes several experiment links from an ICE entry. ICE has no batch resource to remove
+        them in a single request, so if there are several, the DELETE requests are sent
+        concurrently over the session's pooled connections.
+        :param ice_entry_id: the identifier of the ICE entry
+        :param link_ids: the unique IDs of the links to remove
+        :raises HTTPError if a communication error occurred or if the server responded with a
+            status code other than 200 for any of the links. The first error is re-raised once
+            all the requests have completed.
+        """
+        link_ids = list(link_ids)
+        if len(link_ids) < 2:
+            for link_id in link_ids:
+                self.remove_experiment_link(ice_entry_id, link_id)
+            return
+        max_workers = min(len(link_ids), MAX_CONCURRENT_LINK_REMOVALS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.remove_experiment_link, ice_entry_id, link_id)
+                for link_id in link_ids
+            ]
+        # re-raise the first error, if any, now that all the requests have completed
+        for future in futures:
+            future.result()
 
     def remove_experiment_link(self, ice_entry_id, link_id):
         """
@@ -1447,7 +1892,11 @@ class IceApi(RestApiClient):
 
         entry_experiments_rest_url = self._build_entry_experiments_url(ice_entry_id)
         link_resource_uri = entry_experiments_rest_url + "%s/" % link_id
-        response = self.session.delete(link_resource_uri)
+        try:
+            response = self.session.delete(link_resource_uri)
+        finally:
+            # the entry may have changed, even if the request failed
+            self.invalidate_entry(ice_entry_id)
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
@@ -1460,6 +1909,7 @@ class IceApi(RestApiClient):
         logger=logger,
         old_study_name=None,
         old_study_url=None,
+        existing_links=None,
     ):
         """
         Communicates with ICE to link an ICE entry to an EDD study, or if a link to this URL
@@ -1467,10 +1917,8 @@ class IceApi(RestApiClient):
         uses this URL (even for entries other than the one specified by ice_entry_id). See
         comments on SYNBIO-1196.
         Note that because of the way ICE's REST API responds, this implementation performs multiple
-        round-trips to  ICE to check whether the link exists before creating it. A future
-        improvement is to fully characterize / unit test the ICE API's behavior, then to provide
-        a more efficient low-level alternative to support clients that have already performed
-        their own checking.
+        round-trips to  ICE to check whether the link exists before creating it, unless the
+        caller provides existing_links.
         :param ice_entry_id: the string used to identify the strain ( either the string
             representation of the number displayed in the URL, or the UUID stored in EDD's
             database)
@@ -1487,11 +1935,14 @@ class IceApi(RestApiClient):
             URL has changed). If provided, all ICE links referencing this URL (case insensitive)
             will be updated to use the new URL, unless it exactly matches study_url, in which case
             it's ignored.
+        :param existing_links: the JSON dictionaries for the entry's existing experiment links,
+            if the caller already has them. If provided, the request to look them up in ICE is
+            skipped.
         :raises HTTPError if a communication error occurred or if the server responded with a
             status code other than 200
         :raises requests.exceptions.Timeout if a communication timeout occurs.
         """
-        logger.info("Start " + self.link_entry_to_study.__name__ + "()")
+        logger.info("Start link_entry_to_study()")
         self._prevent_write_while_disabled()
 
         # NOTE: this implementation works, but can probably be simplified based on how ICE actually
@@ -1501,31 +1952,22 @@ class IceApi(RestApiClient):
         # study, since ICE won't support multiple links to the same URL (the latest just
         # overwrites).
 
-        # query ICE to get the list of existing links for this part
+        # query ICE to get the list of existing links for this part, unless they were provided
         entry_experiments_rest_url = self._build_entry_experiments_url(ice_entry_id)
         logger.info(entry_experiments_rest_url)
-        response = self.session.get(
-            entry_experiments_rest_url, headers=_JSON_CONTENT_TYPE_HEADER
-        )
-        if response.status_code != requests.codes.ok:
-            response.raise_for_status()
+        if existing_links is None:
+            existing_links = self._get_entry_link_dicts(ice_entry_id)
 
         # inspect results to find the unique ID's for any pre-existing links referencing this
         # study's URL
         label_key = "label"
         url_key = "url"
-        existing_links = (
-            response.json()
-        )  # TODO: doesn't account for results paging see EDD-200
 
-        current_study_links = self._find_current_study_links(
-            existing_links, study_name, study_url, label_key, url_key
-        )
         if not old_study_name or old_study_name == study_name:
             old_study_name = None
-        if not old_study_url and old_study_url == study_url:
+        if not old_study_url or old_study_url.casefold() == study_url.casefold():
             old_study_url = None
-        outdated_study_links = self._find_outdated_study_links(
+        current_study_links, outdated_study_links = self._classify_study_links(
             existing_links,
             study_name,
             study_url,
@@ -1535,9 +1977,9 @@ class IceApi(RestApiClient):
             url_key,
         )
 
-        logger.debug("Existing links: " + str(existing_links))
-        logger.debug("Current study links:" + str(current_study_links))
-        logger.debug("Outdated study links: " + str(outdated_study_links))
+        logger.debug("Existing links: %s", existing_links)
+        logger.debug("Current study links: %s", current_study_links)
+        logger.debug("Outdated study links: %s", outdated_study_links)
 
         # if there's at least one up-to-date link to the study, and there are no outdated links to
         # it, just return without making any changes
@@ -1545,31 +1987,25 @@ class IceApi(RestApiClient):
             return
 
         # create or update study links
-        if outdated_study_links:
-            for outdated_link in outdated_study_links:
+        try:
+            if outdated_study_links:
+                for outdated_link in outdated_study_links:
+                    self._create_or_update_link(
+                        study_name,
+                        study_url,
+                        entry_experiments_rest_url,
+                        link_id=outdated_link.get("id"),
+                        created=outdated_link.get("created"),
+                    )
+            else:
                 self._create_or_update_link(
-                    study_name,
-                    study_url,
-                    entry_experiments_rest_url,
-                    link_id=outdated_link.get("id"),
-                    created=outdated_link.get("created"),
+                    study_name, study_url, entry_experiments_rest_url
                 )
-        else:
-            self._create_or_update_link(
-                study_name, study_url, entry_experiments_rest_url
-            )
-
-    def _find_current_study_links(
-        self, existing_links, study_name, study_url, label_key, url_key
-    ):
-        def is_current_link(link):
-            return study_url.lower() == link.get(
-                url_key
-            ).lower() and study_name == link.get(label_key)
-
-        return [link for link in existing_links if is_current_link(link)]
+        finally:
+            # the entry and its links have changed, or may have if there was an error
+            self.invalidate_entry(ice_entry_id)
 
-    def _find_outdated_study_links(
+    def _classify_study_links(
         self,
         existing_links,
         study_name,
@@ -1579,16 +2015,33 @@ class IceApi(RestApiClient):
         label_key,
         url_key,
     ):
-        def is_outdated_link(link):
-            if old_study_name:
-                return study_url.lower() == link.get(
-                    url_key
-                ).lower() and old_study_name == link.get(label_key)
-            if old_study_url:
-                return old_study_url.lower() == link.get(url_key).lower()
-            return False
-
-        return [link for link in existing_links if is_outdated_link(link)]
+        """
+        Sorts an entry's existing experiment links into those that are current links to the
+        study, and those that are outdated links to it, in a single pass over the links. URLs
+        are compared case-insensitively.
+        :return: a tuple of (current study links, outdated study links)
+        """
+        folded_study_url = study_url.casefold()
+        folded_old_study_url = old_study_url.casefold() if old_study_url else None
+        current_study_links = []
+        outdated_study_links = []
+
+        for link in existing_links:
+            folded_link_url = (link.get(url_key) or "").casefold()
+            link_label = link.get(label_key)
+            if folded_link_url == folded_study_url:
+                if link_label == study_name:
+                    current_study_links.append(link)
+                elif old_study_name and link_label == old_study_name:
+                    outdated_study_links.append(link)
+            elif (
+                not old_study_name
+                and folded_old_study_url
+                and folded_link_url == folded_old_study_url
+            ):
+                outdated_study_links.append(link)
+
+        return current_study_links, outdated_study_links
 
     def build_entry_ui_url(self, entry_id):
         return build_entry_ui_url(self.base_url, entry_id)
@@ -1596,9 +2049,8 @@ class IceApi(RestApiClient):
 
 def calculate_pages(count, offset, limit):
     current = offset // limit
-    following = current + 1
-    if following * limit > count or current * limit >= count:
-        following = None
+    # there's only a following page if some results remain after the end of the current one
+    following = current + 1 if (current + 1) * limit < count else None
     previous = current - 1 if current >= 1 else None
     return previous, current, following
 
@@ -1623,21 +2075,47 @@ def extract_int_parameter(dictionary, key):
     return 0
 
 
-def construct_page_url(elements, params, index, limit):
-    if params and index is not None:
-        params[constants.RESULT_LIMIT_PARAMETER] = limit
-        params[constants.RESULT_OFFSET_PARAMETER] = index * limit
-        query = urlencode(params, True)
-        inputs = ParseResult(
-            elements.scheme,
-            elements.netloc,
-            elements.path,
-            elements.params,
-            query,
-            elements.fragment,
-        )
-        return urlunparse(inputs)
-    return None
+_PAGING_PARAMETERS = (constants.RESULT_LIMIT_PARAMETER, constants.RESULT_OFFSET_PARAMETER)
+
+
+def encode_non_paging_params(params):
+    """
+    URL-encodes query parameters other than those that control paging, so the result can be
+    shared by construct_page_url() calls for several pages of the same query
+    :return: the encoded query string, or None if params is empty
+    """
+    if not params:
+        return None
+    return urlencode(
+        {
+            key: value
+            for key, value in params.items()
+            if key not in _PAGING_PARAMETERS
+        },
+        True,
+    )
+
+
+def construct_page_url(elements, base_query, index, limit):
+    """
+    Builds the URL for a page of query results
+    :param elements: the parsed URL of the query
+    :param base_query: the query string without paging parameters, from
+        encode_non_paging_params(), or None if the URL has no query parameters
+    :param index: the 0-indexed page number, or None if there's no such page
+    :param limit: the maximum number of results per page
+    :return: the URL, or None if index or base_query are None
+    """
+    if base_query is None or index is None:
+        return None
+    paging_query = "%s=%d&%s=%d" % (
+        constants.RESULT_LIMIT_PARAMETER,
+        limit,
+        constants.RESULT_OFFSET_PARAMETER,
+        index * limit,
+    )
+    query = "%s&%s" % (base_query, paging_query) if base_query else paging_query
+    return urlunparse(elements._replace(query=query))
 
 
 class IcePagedResult(PagedResult):
@@ -1654,7 +2132,9 @@ class IcePagedResult(PagedResult):
     ):
         """
         Reads a JSON string into a PagedResult containing Python objects.
-        :param json_string: the result string to read / deserialize
+        :param json_string: the result string to read / deserialize. Raw response bytes are
+            preferred, since json.loads() detects their UTF encoding directly, while decoding
+            Response.text may require a much slower guess at the character set.
         :param query_url: the complete URL for this query, or if query can't be accessed as a
             URL only, the URL that most closely matches that used to perform the query. Used to
             construct the prev_page/next_page links that should help simplify client code and make
@@ -1718,24 +2198,23 @@ class IcePagedResult(PagedResult):
                     count, offset, result_limit
                 )
 
-            # if a query URL was provided, construct next/prev URL's by deconstructing the URL for
-            # the current query, then reconstructing it using the next/prev page indices computed
-            # above
-            next_page_url = construct_page_url(
-                url_elts, query_params_dict, next_page_index, result_limit
-            )
-            prev_page_url = construct_page_url(
-                url_elts, query_params_dict, prev_page_index, result_limit
-            )
+                # if a query URL was provided, construct next/prev URL's by deconstructing the
+                # URL for the current query, then reconstructing it using the next/prev page
+                # indices computed above
+                if next_page_index is not None or prev_page_index is not None:
+                    base_query = encode_non_paging_params(query_params_dict)
+                    next_page_url = construct_page_url(
+                        url_elts, base_query, next_page_index, result_limit
+                    )
+                    prev_page_url = construct_page_url(
+                        url_elts, base_query, prev_page_index, result_limit
+                    )
 
         # otherwise just deserialize the (un-paged) data
         else:
             response_content = json_dict
 
-        # iterate through the returned data, deserializing each object found
-        results_obj_list = []
-        for object_dict in response_content:
-            result_object = factory_class.of(object_dict)
-            results_obj_list.append(result_object)
+        # deserialize each object found in the returned data
+        results_obj_list = [factory_class.of(object_dict) for object_dict in response_content]
 
         return IcePagedResult(results_obj_list, count, next_page_url, prev_page_url)
@@ -2,11 +2,13 @@
 Defines utility classes for use in HTTP request generation.
 """
 import logging
+from urllib.parse import parse_qs
 
 import arrow
+from requests.adapters import HTTPAdapter
 from requests.compat import urlsplit
+from requests.packages.urllib3.util.retry import Retry
 from requests.sessions import Session as SessionApi
-from six.moves.urllib.parse import parse_qs
 
 logger = logging.getLogger(__name__)
 
@@ -256,3 +258,32 @@ class PagedResult(object):
 VERIFY_KEY = "verify"
 TIMEOUT_KEY = "timeout"
 AUTH_KEY = "auth"
+
+
+def mount_retrying_adapter(
+    session, pool_connections, pool_maxsize, max_retries, backoff_factor
+):
+    """
+    Mounts an HTTPAdapter on a session that keeps enough connections alive for concurrent
+    requests, and that retries connection failures and transient gateway errors. Retry's
+    defaults limit retries to idempotent methods, so e.g. a POST is never repeated. If retries
+    are exhausted, the last response is returned so callers still see the same HTTPErrors.
+    :param session: the requests session to configure
+    :param pool_connections: the number of connection pools to cache in the adapter
+    :param pool_maxsize: the maximum number of connections to keep alive in each pool. This
+        should be at least the number of threads making concurrent requests.
+    :param max_retries: the maximum number of retries for connection errors and 502/503/504
+        responses to idempotent requests
+    :param backoff_factor: the backoff factor for the delay between retries
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
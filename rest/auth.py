@@ -5,6 +5,8 @@ import hashlib
 import hmac
 import json
 import logging
+import re
+from operator import itemgetter
 import requests
 
 from requests.auth import AuthBase
@@ -31,26 +33,42 @@ class HmacAuth(AuthBase):
     :raises ValueError if no user email address is provided.
     """
     KEYSTORE = {}
+    # keyed HMAC state for each registered key, built once at registration so instances don't
+    # have to decode the key and process it again. Templates are never updated, only copied
+    _HMAC_TEMPLATES = {}
 
     @classmethod
     def deregister_key(cls, key_id):
         del cls.KEYSTORE[key_id]
+        cls._HMAC_TEMPLATES.pop(key_id, None)
 
     @classmethod
     def register_key(cls, key_id, secret_key):
         cls.KEYSTORE[key_id] = secret_key
+        if secret_key:
+            # the secret key is registered base64-encoded
+            cls._HMAC_TEMPLATES[key_id] = hmac.new(base64.b64decode(secret_key),
+                                                   digestmod=hashlib.sha1)
+        else:
+            cls._HMAC_TEMPLATES.pop(key_id, None)
 
     def __init__(self, key_id, username=None):
         """
         :param key_id: identifier of the key registered with HmacAuth
         :param username: the ID of the user to send to the remote service
         """
-        secret_key = self.KEYSTORE.get(key_id, None)
-        if not secret_key:
+        hmac_template = self._HMAC_TEMPLATES.get(key_id, None)
+        if hmac_template is None:
             raise ValueError("A secret key is required input for HMAC authentication")
         self._KEY_ID = key_id
         self._USERNAME = username
-        self._SECRET_KEY = secret_key
+        # keyed HMAC state, copied for each request so the key is only processed once. The
+        # template itself is never updated, so copying it is safe from multiple threads
+        self._HMAC_TEMPLATE = hmac_template
+        # The version 1 spec of the HmacSignature class calls for the Authorization HTTP header
+        #   of the form: {Version}:{KeyId}:{UserId}:{Signature}. Everything but the
+        #   signature is the same for every request, so build it only once
+        self._HEADER_PREFIX = ':'.join(('1', key_id, username or '', ''))
 
     def __call__(self, request):
         """
@@ -61,11 +79,8 @@ class HmacAuth(AuthBase):
         # generate a signature for the message by hashing the request using the secret key
         sig = self._build_signature(request)
 
-        # add message headers including the username (if present) and message
-        # The version 1 spec of the HmacSignature class calls for the Authorization HTTP header
-        #   of the form: {Version}:{KeyId}:{UserId}:{Signature}
-        header = ':'.join(('1', self._KEY_ID, self._USERNAME, sig))
-        request.headers['Authorization'] = header
+        # add message header including the signature, after the per-instance prefix
+        request.headers['Authorization'] = self._HEADER_PREFIX + sig
         return request
 
     def _build_message(self, request):
@@ -83,43 +98,45 @@ class HmacAuth(AuthBase):
         #   * Request path (e.g. /path/to/resource/)
         #   * SORTED query string, keyed by natural UTF8 byte-ordering of names
         #   * Request Body
-        delimiter = '\n'
-        body = ''
-        if request.body:
-            # Django request object has body as bytes; requests request object has body as str
-            if isinstance(request.body, bytes):
-                body = request.body.decode('utf-8')
-            else:
-                body = request.body
-        msg = delimiter.join((
+        # build the message as bytes directly so a (potentially large) body that's already
+        # bytes isn't decoded, then re-encoded
+        body = request.body or b''
+        if not isinstance(body, bytes):
+            # Django request object has body as bytes; requests request object may have body as
+            # str
+            body = body.encode('utf-8')
+        msg_header = '\n'.join((
             self._USERNAME or '',
             request.method,
             url.netloc,
             url.path,
             self._sort_parameters(url.query),
-            body,
+            '',
         ))
-        return msg.encode('utf-8')
+        return msg_header.encode('utf-8') + body
 
     def _build_signature(self, request):
         """
         Builds a signature for the provided request message based on the secret key.
         """
-        key = base64.b64decode(self._SECRET_KEY)
         msg = self._build_message(request)
-        digest = hmac.new(key, msg=msg, digestmod=hashlib.sha1).digest()
+        mac = self._HMAC_TEMPLATE.copy()
+        mac.update(msg)
+        digest = mac.digest()
         sig = base64.b64encode(digest).decode()
         return sig
 
     def _sort_parameters(self, query):
-        # split on ampersand
-        params = query.split('&')
-        # split each param into two-item lists of (key,value) and quote list entries
-        params = [[quote(unquote(v)) for v in item.split('=', 1)] for item in params]
-        # sort based on key portion
-        params = sorted(params, key=lambda p: p[0])
+        # most signed requests have no query string at all
+        if not query:
+            return ''
+        # split on ampersand, then split each param into two-item lists of (key,value) and quote
+        # list entries
+        params = [[quote(unquote(v)) for v in item.split('=', 1)] for item in query.split('&')]
+        # sort based on key portion. The sort is stable, so repeated keys keep their order
+        params.sort(key=itemgetter(0))
         # join back together on ampersand
-        return '&'.join(map(lambda p: '='.join(p), params))
+        return '&'.join(['='.join(p) for p in params])
 
 
 # ICE's current automatic limit on results returned in the absence of a specific requested
@@ -214,6 +231,8 @@ class IceSessionAuth(AuthBase):
 
 
 DJANGO_CSRF_COOKIE_KEY = 'csrftoken'
+# finds the value of Django's CSRF cookie in a Cookie request header
+_CSRF_COOKIE_PATTERN = re.compile(r'(?:^|;)\s*%s=([^;]*)' % DJANGO_CSRF_COOKIE_KEY)
 
 
 def insert_spoofed_https_csrf_headers(headers, base_url):
@@ -234,8 +253,9 @@ def insert_spoofed_https_csrf_headers(headers, base_url):
     # http://security.stackexchange.com/questions/96114/why-is-referer-checking-needed-for-django
     # http://mathieu.fenniak.net/is-your-web-api-susceptible-to-a-csrf-exploit/
     # -to-prevent-csrf
-    if urlparse(base_url).scheme == 'https':
-        headers['Host'] = urlsplit(base_url).netloc
+    url = urlsplit(base_url)
+    if url.scheme == 'https':
+        headers['Host'] = url.netloc
         headers['Referer'] = base_url  # LOL! Bad spelling is now standard :-)
 
 
@@ -255,14 +275,10 @@ class EddSessionAuth(AuthBase):
         """
         self.prev_request = request  # TODO: for debugging, remove
         if request.body:
-            # the CSRF token can change; pull the correct value out of cookie
-            try:
-                jar = request.headers['Cookie']
-                label = 'csrftoken='
-                offset = jar.find(label) + len(label)
-                request.headers['X-CSRFToken'] = jar[offset:jar.find(';', offset)]
-            except Exception as e:
-                pass
+            # the CSRF token can change; pull the correct value out of cookie, if it's there
+            match = _CSRF_COOKIE_PATTERN.search(request.headers.get('Cookie', ''))
+            if match:
+                request.headers['X-CSRFToken'] = match.group(1)
         return request
 
     def apply_session_token(self, session_obj):
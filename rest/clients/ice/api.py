@@ -68,7 +68,9 @@ VERIFY_SSL_DEFAULT = Session.VERIFY_SSL_DEFAULT
 
 ###################################################################################################
 
-_JSON_CONTENT_TYPE_HEADER = {'Content-Type': 'application/json; charset=utf8'}
+# default headers for every request made by an IceApi's session, so they aren't passed and
+# merged separately for each request
+_JSON_HEADERS = {'Accept': 'application/json', 'Content-Type': 'application/json; charset=utf8'}
 
 # regular expressions for parsing elements of ICE URLs
 _PROTOCOL = 'http|https'
@@ -683,6 +685,9 @@ def parse_entry_id(ice_entry_url):
     :return: the identifier for the part within its host
     ICE deployment, or None if the input didn't match the expected pattern.
     """
+    # cheap substring test first, since most URLs checked aren't ICE entry URLs at all
+    if not ice_entry_url or '/entry/' not in ice_entry_url.lower():
+        return None
     match = ICE_ENTRY_URL_PATTERN.match(ice_entry_url)
     if not match:
         return None
@@ -731,6 +736,7 @@ class IceApi(RestApiClient):
             raise ValueError("A valid authentication mechanism must be provided")
         session = PagedSession(constants.RESULT_LIMIT_PARAMETER, result_limit, auth=auth,
                                verify_ssl_cert=verify_ssl_cert)
+        session.headers.update(_JSON_HEADERS)
         super(IceApi, self).__init__('ICE', base_url, session, result_limit)
 
     def _compute_result_offset(self, page_number):
@@ -814,17 +820,13 @@ class IceApi(RestApiClient):
 
         response = None
         if query_url:
-            response = self.session.get(query_url, headers=_JSON_CONTENT_TYPE_HEADER)
+            response = self.session.get(query_url)
         else:
             query_params = {}
             self._add_page_number_param(query_params, page_number)
             # execute the query
             url = '%s/rest/parts/%s/experiments/' % (self.base_url, entry_id)
-            response = self.session.get(
-                url,
-                params=query_params,
-                headers=_JSON_CONTENT_TYPE_HEADER
-            )
+            response = self.session.get(url, params=query_params)
             query_url = response.url
         if response.status_code == requests.codes.ok:
             return IcePagedResult.of(response.text, ExperimentLink, query_url=query_url)
@@ -847,15 +849,13 @@ class IceApi(RestApiClient):
 
         response = None
         if query_url:
-            response = self.session.get(query_url, headers=_JSON_CONTENT_TYPE_HEADER)
+            response = self.session.get(query_url)
         else:
             query_params = {}
             self._add_page_number_param(query_params, page_number)
             # execute the query
             url = '%s/rest/parts/%s/samples/' % (self.base_url, entry_id)
-            response = self.session.get(
-                url, params=query_params, headers=_JSON_CONTENT_TYPE_HEADER
-            )
+            response = self.session.get(url, params=query_params)
             query_url = response.url
         if response.status_code == requests.codes.ok:
             return IcePagedResult.of(response.text, Sample, query_url=query_url)
@@ -1097,7 +1097,7 @@ class IceApi(RestApiClient):
         logger.info('Searching for ICE entries using search terms "%s"' % search_terms)
         url = '%s/rest/search' % self.base_url
         query_json = json.dumps({'queryString': search_terms})
-        response = self.session.post(url, data=query_json, headers=_JSON_CONTENT_TYPE_HEADER)
+        response = self.session.post(url, data=query_json)
         response.raise_for_status()
         results = json.loads(response.text)
         return [record['entryInfo'] for record in results['results']]
@@ -1154,9 +1154,7 @@ class IceApi(RestApiClient):
 
         # execute the query
         try:
-            response = self.session.post(
-                url, data=optional_query_data, headers=_JSON_CONTENT_TYPE_HEADER
-            )
+            response = self.session.post(url, data=optional_query_data)
             # if response was good, deconstruct the query url, then build a separate 'get' URL
             # to use in next/prev page links. Note that for now, we're leaving this code /
             # incorrect URL in place as a placeholder for future code. Presence / absence of
@@ -1218,7 +1216,6 @@ class IceApi(RestApiClient):
             (link_id, entry_experiments_url)
         )
 
-        headers = {'Content-Type': 'application/json'}
         json_dict = {'label': study_name, 'url': study_url}
         # if we're updating an existing link, use its full url
         if link_id:
@@ -1227,7 +1224,7 @@ class IceApi(RestApiClient):
         json_str = json.dumps(json_dict)
 
         session = self.session
-        response = session.post(entry_experiments_url, data=json_str, headers=headers)
+        response = session.post(entry_experiments_url, data=json_str)
 
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
@@ -1255,10 +1252,7 @@ class IceApi(RestApiClient):
 
         # Look up the links associated with this ICE part
         entry_experiments_rest_url = self._build_entry_experiments_url(ice_entry_id)
-        response = self.session.get(
-            entry_experiments_rest_url,
-            headers=_JSON_CONTENT_TYPE_HEADER
-        )
+        response = self.session.get(entry_experiments_rest_url)
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
@@ -1339,9 +1333,7 @@ class IceApi(RestApiClient):
         # query ICE to get the list of existing links for this part
         entry_experiments_rest_url = self._build_entry_experiments_url(ice_entry_id)
         logger.info(entry_experiments_rest_url)
-        response = self.session.get(
-            entry_experiments_rest_url, headers=_JSON_CONTENT_TYPE_HEADER
-        )
+        response = self.session.get(entry_experiments_rest_url)
         if response.status_code != requests.codes.ok:
             response.raise_for_status()
 
@@ -1351,21 +1343,25 @@ class IceApi(RestApiClient):
         url_key = 'url'
         existing_links = response.json()  # TODO: doesn't account for results paging see EDD-200
 
+        # normalize each link's URL and look up its label just once, rather than once per test
+        normalized_links = [
+            (link, (link.get(url_key) or '').lower(), link.get(label_key))
+            for link in existing_links
+        ]
         current_study_links = self._find_current_study_links(
-            existing_links, study_name, study_url, label_key, url_key
+            normalized_links, study_name, study_url
         )
         if not old_study_name or old_study_name == study_name:
             old_study_name = None
-        if not old_study_url and old_study_url == study_url:
+        if not old_study_url or old_study_url.lower() == study_url.lower():
             old_study_url = None
         outdated_study_links = self._find_outdated_study_links(
-            existing_links, study_name, study_url, old_study_name, old_study_url,
-            label_key, url_key,
+            normalized_links, study_url, old_study_name, old_study_url
         )
 
-        logger.debug('Existing links: ' + str(existing_links))
-        logger.debug('Current study links:' + str(current_study_links))
-        logger.debug('Outdated study links: ' + str(outdated_study_links))
+        logger.debug('Existing links: %s', existing_links)
+        logger.debug('Current study links: %s', current_study_links)
+        logger.debug('Outdated study links: %s', outdated_study_links)
 
         # if there's at least one up-to-date link to the study, and there are no outdated links to
         # it, just return without making any changes
@@ -1382,26 +1378,34 @@ class IceApi(RestApiClient):
         else:
             self._create_or_update_link(study_name, study_url, entry_experiments_rest_url)
 
-    def _find_current_study_links(self, existing_links, study_name, study_url, label_key, url_key):
-        def is_current_link(link):
-            return (
-                study_url.lower() == link.get(url_key).lower() and
-                study_name == link.get(label_key)
-            )
-        return [link for link in existing_links if is_current_link(link)]
-
-    def _find_outdated_study_links(self, existing_links, study_name, study_url, old_study_name,
-                                   old_study_url, label_key, url_key):
-        def is_outdated_link(link):
-            if old_study_name:
-                return (
-                    study_url.lower() == link.get(url_key).lower() and
-                    old_study_name == link.get(label_key)
-                )
-            if old_study_url:
-                return old_study_url.lower() == link.get(url_key).lower()
-            return False
-        return [link for link in existing_links if is_outdated_link(link)]
+    def _find_current_study_links(self, normalized_links, study_name, study_url):
+        """
+        :param normalized_links: (link, lower-case link URL, link label) tuples for the links
+        """
+        lower_study_url = study_url.lower()
+        return [
+            link for link, lower_url, label in normalized_links
+            if lower_url == lower_study_url and label == study_name
+        ]
+
+    def _find_outdated_study_links(self, normalized_links, study_url, old_study_name,
+                                   old_study_url):
+        """
+        :param normalized_links: (link, lower-case link URL, link label) tuples for the links
+        """
+        if old_study_name:
+            lower_study_url = study_url.lower()
+            return [
+                link for link, lower_url, label in normalized_links
+                if lower_url == lower_study_url and label == old_study_name
+            ]
+        if old_study_url:
+            lower_old_study_url = old_study_url.lower()
+            return [
+                link for link, lower_url, _ in normalized_links
+                if lower_url == lower_old_study_url
+            ]
+        return []
 
     def build_entry_ui_url(self, entry_id):
         return build_entry_ui_url(self.base_url, entry_id)
@@ -1,7 +1,22 @@
 # -*- coding: utf-8 -*-
 
+import os
+import tempfile
+
 from django.test import TestCase
 
+from edd.rest.scripts.maintain_ice_links import (
+    read_processed_strains,
+    write_processed_strains,
+)
+from jbei.rest.auth import _CSRF_COOKIE_PATTERN, IceSessionAuth
+from jbei.rest.clients.ice.api import (
+    IceApi,
+    _convert_json_keywords,
+    calculate_pages,
+    parse_entry_id,
+)
+
 from .rest.auth import HmacAuth
 
 
@@ -61,4 +76,101 @@ class IceTests(TestCase):
         uri = "http://registry.jbei.org/entry/12345/experiments"
         self.assertIsNone(ICE_ENTRY_URL_PATTERN.match(uri))
         uri = "http://registry.jbei.org/entry/foobar"
-        self.assertIsNone(ICE_ENTRY_URL_PATTERN.match(uri))
\ No newline at end of file
+        self.assertIsNone(ICE_ENTRY_URL_PATTERN.match(uri))
+
+    def test_parse_entry_id(self):
+        self.assertEqual(
+            "49194", parse_entry_id("https://registry-test.jbei.org/entry/49194/")
+        )
+        uri = (
+            "https://registry-test.jbei.org/entry/761ec36a-cd17-41b8-a348-45d7552d4f4f"
+        )
+        self.assertEqual("761ec36a-cd17-41b8-a348-45d7552d4f4f", parse_entry_id(uri))
+        self.assertIsNone(parse_entry_id(None))
+        self.assertIsNone(parse_entry_id("https://edd.jbei.org/study/10/"))
+        self.assertIsNone(parse_entry_id("ftp://registry.jbei.org/entry/12345"))
+        uri = "http://registry.jbei.org/entry/12345/experiments"
+        self.assertIsNone(parse_entry_id(uri))
+        self.assertIsNone(parse_entry_id("http://registry.jbei.org/entry/foobar"))
+        self.assertIsNone(parse_entry_id("http://registry.jbei.org/entry/12345?a=b"))
+
+    def test_convert_json_keywords(self):
+        json_dict = {"creatorEmail": "a@b.org", "status": "Complete"}
+        converted = _convert_json_keywords(json_dict, {"creatorEmail": "creator_email"})
+        self.assertEqual({"creator_email": "a@b.org", "status": "Complete"}, converted)
+        # the input is left unchanged
+        self.assertEqual({"creatorEmail": "a@b.org", "status": "Complete"}, json_dict)
+
+    def test_classify_study_links(self):
+        auth = IceSessionAuth("session-id")
+        ice = IceApi(auth, base_url="https://registry-test.jbei.org")
+        study_url = "https://edd.jbei.org/s/study/"
+        old_url = "https://edd.jbei.org/study/10/"
+        current = {"id": 1, "label": "Study", "url": study_url.upper()}
+        renamed = {"id": 2, "label": "Old Study", "url": study_url}
+        moved = {"id": 3, "label": "Study", "url": old_url}
+        other = {"id": 4, "label": "Other", "url": "https://example.org/"}
+        links = [current, renamed, moved, other]
+
+        # a rename takes precedence over a URL change
+        self.assertEqual(
+            ([current], [renamed]),
+            ice._classify_study_links(
+                links, "Study", study_url, "Old Study", old_url, "label", "url"
+            ),
+        )
+        self.assertEqual(
+            ([current], [moved]),
+            ice._classify_study_links(
+                links, "Study", study_url, None, old_url.upper(), "label", "url"
+            ),
+        )
+        self.assertEqual(
+            ([current], []),
+            ice._classify_study_links(
+                links, "Study", study_url, None, None, "label", "url"
+            ),
+        )
+
+    def test_calculate_pages(self):
+        # (previous, current, following) page indexes for 30 results, 15 per page
+        self.assertEqual((None, 0, 1), calculate_pages(30, 0, 15))
+        # the last page ends exactly at the result count, so there's no following page
+        self.assertEqual((0, 1, None), calculate_pages(30, 15, 15))
+        self.assertEqual((0, 1, None), calculate_pages(29, 15, 15))
+        self.assertEqual((0, 1, 2), calculate_pages(31, 15, 15))
+        self.assertEqual((None, 0, None), calculate_pages(15, 0, 15))
+
+
+class EddSessionAuthTests(TestCase):
+    def test_csrf_cookie_pattern(self):
+        def find_token(cookie):
+            match = _CSRF_COOKIE_PATTERN.search(cookie)
+            return match.group(1) if match else None
+
+        self.assertEqual("abc", find_token("csrftoken=abc"))
+        self.assertEqual("abc", find_token("sessionid=123; csrftoken=abc"))
+        self.assertEqual("abc", find_token("csrftoken=abc; sessionid=123"))
+        self.assertIsNone(find_token("sessionid=123"))
+        self.assertIsNone(find_token("sessionid=123; xcsrftoken=abc"))
+        self.assertIsNone(find_token(""))
+
+
+class MaintainIceLinksTests(TestCase):
+    def test_resume_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            resume_file = os.path.join(temp_dir, "resume.json")
+            # no resume file yet
+            self.assertEqual([], read_processed_strains(resume_file))
+
+            uuids = {
+                "761ec36a-cd17-41b8-a348-45d7552d4f4f",
+                "0a3b0e47-8c1e-4b65-9b6b-1b6a1e5f9c0d",
+            }
+            write_processed_strains(resume_file, uuids)
+            self.assertEqual(sorted(uuids), read_processed_strains(resume_file))
+            self.assertFalse(os.path.exists("%s.tmp" % resume_file))
+
+            # later writes replace the earlier contents
+            write_processed_strains(resume_file, set())
+            self.assertEqual([], read_processed_strains(resume_file))